@@ -242,7 +242,7 @@ def normalize_detail_uid_value(value: Any) -> str:
     if not text:
         raise ValueError("detail_uid is required")
     if "-" in text:
-        raw_work_id, raw_detail_id = text.split("-", 1)
+        raw_work_id, _separator, raw_detail_id = text.partition("-")
     else:
         digits = "".join(ch for ch in text if ch.isdigit())
         if len(digits) != 8:
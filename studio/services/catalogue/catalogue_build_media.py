@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
+import contextlib
+import itertools
 import os
 import re
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping, Sequence
+from typing import Any, Callable, Dict, Iterator, Mapping, Sequence
 
 from catalogue.catalogue_source import records_from_json_source, slug_id
 from catalogue import catalogue_public_paths as public_paths
@@ -38,6 +42,12 @@ WEBP_PRESET = str(PIPELINE_CONFIG["encoding"]["preset"])
 THUMB_Q = int(PIPELINE_CONFIG["encoding"]["thumb_quality"])
 PRIMARY_Q = int(PIPELINE_CONFIG["encoding"]["primary_quality"])
 COMPRESSION_LEVEL = int(PIPELINE_CONFIG["encoding"]["compression_level"])
+SIPS_PIXEL_WIDTH_PATTERN = re.compile(r"pixelWidth:\s*([0-9]+)")
+SIPS_PIXEL_HEIGHT_PATTERN = re.compile(r"pixelHeight:\s*([0-9]+)")
+# One media item yields a thumbnail plus each primary width; encode those side by side.
+MEDIA_ENCODE_MAX_WORKERS = len(THUMB_SIZES) + len(PRIMARY_WIDTHS)
+MEDIA_STAGE_MAX_WORKERS = 4
+THUMBNAIL_ONLY_MAX_WORKERS = 4
 
 MediaPlanBuilder = Callable[..., Dict[str, Any]]
 FfmpegRunner = Callable[[Path, int, Path], tuple[int, str]]
@@ -89,10 +99,10 @@ def parse_sips_pixel_dims(output: str) -> tuple[int | None, int | None]:
     width = None
     height = None
     for line in output.splitlines():
-        width_match = re.search(r"pixelWidth:\s*([0-9]+)", line)
+        width_match = SIPS_PIXEL_WIDTH_PATTERN.search(line)
         if width_match:
             width = int(width_match.group(1))
-        height_match = re.search(r"pixelHeight:\s*([0-9]+)", line)
+        height_match = SIPS_PIXEL_HEIGHT_PATTERN.search(line)
         if height_match:
             height = int(height_match.group(1))
     return width, height
@@ -113,10 +123,11 @@ def read_image_dims_px(path: Path | None) -> tuple[int | None, int | None]:
 
 
 def repo_relative_path(path: Path, repo_root: Path) -> str:
+    resolved = path.resolve()
     try:
-        return str(path.resolve().relative_to(repo_root.resolve())).replace(os.sep, "/")
+        return str(resolved.relative_to(repo_root.resolve())).replace(os.sep, "/")
     except ValueError:
-        return str(path.resolve())
+        return str(resolved)
 
 
 def resolve_work_media_source(
@@ -125,8 +136,9 @@ def resolve_work_media_source(
     *,
     env: Dict[str, str] | None = None,
     record_override: Mapping[str, Any] | None = None,
+    projects_base: tuple[Path | None, str] | None = None,
 ) -> tuple[Path | None, str, Path | None, str]:
-    projects_base_dir, availability_error = detect_projects_base_dir_optional(env)
+    projects_base_dir, availability_error = projects_base or detect_projects_base_dir_optional(env)
     work_record = dict(record_override) if record_override is not None else records.works.get(work_id)
     if not isinstance(work_record, dict):
         raise ValueError(f"work_id not found: {work_id}")
@@ -150,8 +162,9 @@ def resolve_detail_media_source(
     detail_uid: str,
     *,
     env: Dict[str, str] | None = None,
+    projects_base: tuple[Path | None, str] | None = None,
 ) -> tuple[Path | None, str, Path | None, str]:
-    projects_base_dir, availability_error = detect_projects_base_dir_optional(env)
+    projects_base_dir, availability_error = projects_base or detect_projects_base_dir_optional(env)
     detail_record = records.work_details.get(detail_uid)
     if not isinstance(detail_record, dict):
         raise ValueError(f"detail_uid not found: {detail_uid}")
@@ -253,6 +266,22 @@ def path_needs_refresh(path: Path, source_mtime: float) -> bool:
         return True
 
 
+def scan_file_mtimes(directory: Path) -> Dict[str, float]:
+    """Map file names in one directory to mtimes with a single directory enumeration."""
+    mtimes: Dict[str, float] = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        mtimes[entry.name] = entry.stat().st_mtime
+                except OSError:
+                    continue
+    except OSError:
+        return {}
+    return mtimes
+
+
 def thumb_output_paths_for_kind(repo_root: Path, kind: str, item_id: str) -> list[Path]:
     return thumb_output_paths(repo_root, kind, item_id)
 
@@ -479,6 +508,8 @@ def build_local_media_plan(
     records = records_from_json_source(source_dir) if source_dir is not None else None
     if records is None:
         return {"tasks": [], "counts": {"pending": 0, "current": 0, "blocked": 0, "unavailable": 0}}
+    # Resolve and stat the projects base once per plan rather than once per record.
+    projects_base = detect_projects_base_dir_optional(env)
     work_media_sources = scope.get("work_media_sources") if isinstance(scope.get("work_media_sources"), dict) else {}
     for work_id in scope.get("work_ids", []):
         normalized_work_id = str(work_id)
@@ -488,6 +519,7 @@ def build_local_media_plan(
             normalized_work_id,
             env=env,
             record_override=record_override,
+            projects_base=projects_base,
         )
         tasks.append(
             build_local_media_task(
@@ -503,7 +535,12 @@ def build_local_media_plan(
         )
     detail_uid = str(scope.get("detail_uid") or "").strip()
     if detail_uid:
-        source_path, missing_reason, projects_base_dir, availability_error = resolve_detail_media_source(records, detail_uid, env=env)
+        source_path, missing_reason, projects_base_dir, availability_error = resolve_detail_media_source(
+            records,
+            detail_uid,
+            env=env,
+            projects_base=projects_base,
+        )
         tasks.append(
             build_local_media_task(
                 repo_root=repo_root,
@@ -544,6 +581,7 @@ def build_thumbnail_only_task(
     missing_reason: str = "",
     projects_base_dir: Path | None = None,
     force: bool = False,
+    output_mtimes: Mapping[str, float] | None = None,
 ) -> Dict[str, Any]:
     output_paths = thumb_output_paths_for_kind(repo_root, kind, item_id)
     task: Dict[str, Any] = {
@@ -571,7 +609,11 @@ def build_thumbnail_only_task(
     source_mtime = source_path.stat().st_mtime
     pending_outputs: list[Dict[str, Any]] = []
     for size, path in zip(THUMB_SIZES, output_paths):
-        if force or path_needs_refresh(path, source_mtime):
+        if output_mtimes is not None:
+            needs_refresh = output_mtimes.get(path.name, float("-inf")) < source_mtime
+        else:
+            needs_refresh = path_needs_refresh(path, source_mtime)
+        if force or needs_refresh:
             pending_outputs.append(
                 {
                     "size": size,
@@ -594,8 +636,19 @@ def build_catalogue_thumbnail_only_plan(
 ) -> Dict[str, Any]:
     records = records_from_json_source(source_dir)
     tasks: list[Dict[str, Any]] = []
+    # Resolve and stat the projects base once per plan rather than once per record.
+    projects_base = detect_projects_base_dir_optional(env)
+    # Every thumbnail of a kind lives in one directory, so list each directory once
+    # instead of checking and stating every output path separately.
+    work_thumb_mtimes = scan_file_mtimes(thumb_output_dir(repo_root, "work"))
+    detail_thumb_mtimes = scan_file_mtimes(thumb_output_dir(repo_root, "work_details"))
     for work_id in sorted(records.works):
-        source_path, missing_reason, projects_base_dir, availability_error = resolve_work_media_source(records, work_id, env=env)
+        source_path, missing_reason, projects_base_dir, availability_error = resolve_work_media_source(
+            records,
+            work_id,
+            env=env,
+            projects_base=projects_base,
+        )
         tasks.append(
             build_thumbnail_only_task(
                 repo_root=repo_root,
@@ -606,10 +659,16 @@ def build_catalogue_thumbnail_only_plan(
                 missing_reason=missing_reason,
                 projects_base_dir=projects_base_dir,
                 force=force,
+                output_mtimes=work_thumb_mtimes,
             )
         )
     for detail_uid in sorted(records.work_details):
-        source_path, missing_reason, projects_base_dir, availability_error = resolve_detail_media_source(records, detail_uid, env=env)
+        source_path, missing_reason, projects_base_dir, availability_error = resolve_detail_media_source(
+            records,
+            detail_uid,
+            env=env,
+            projects_base=projects_base,
+        )
         tasks.append(
             build_thumbnail_only_task(
                 repo_root=repo_root,
@@ -620,6 +679,7 @@ def build_catalogue_thumbnail_only_plan(
                 missing_reason=missing_reason,
                 projects_base_dir=projects_base_dir,
                 force=force,
+                output_mtimes=detail_thumb_mtimes,
             )
         )
     counts = {
@@ -664,6 +724,7 @@ def execute_catalogue_thumbnail_only_plan(
     current: Dict[str, list[str]] = {"work": [], "work_details": []}
     skipped: Dict[str, list[str]] = {"work": [], "work_details": []}
     messages: list[str] = []
+    record_jobs: list[tuple[str, str, list[tuple[FfmpegRunner, Path, int, Path]]]] = []
 
     for task in tasks:
         kind = str(task.get("kind") or "")
@@ -684,26 +745,56 @@ def execute_catalogue_thumbnail_only_plan(
         if not write:
             planned[kind].append(item_id)
             continue
-        source_path = Path(str(task.get("source_abs_path") or "")).resolve()
+        source_path = Path(str(task.get("source_abs_path") or ""))
         pending_outputs = task.get("pending_outputs") if isinstance(task.get("pending_outputs"), list) else []
+        thumb_jobs: list[tuple[FfmpegRunner, Path, int, Path]] = []
         for output_spec in pending_outputs:
-            output_path = Path(str(output_spec.get("absolute_path") or "")).resolve()
+            output_path = Path(str(output_spec.get("absolute_path") or ""))
             size = int(output_spec.get("size") or THUMB_SIZES[0])
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            exit_code, stderr_tail = run_thumb(source_path, size, output_path)
-            if exit_code != 0:
-                return {
-                    "label": "Regenerate Catalogue Thumbnails",
-                    "status": "failed",
-                    "summary": f"Thumbnail regeneration failed for {kind} {item_id}.",
-                    "generated": generated,
-                    "planned": planned,
-                    "current": current,
-                    "skipped": skipped,
-                    "exit_code": exit_code,
-                    "stderr_tail": stderr_tail,
-                }
-        generated[kind].append(item_id)
+            thumb_jobs.append((run_thumb, source_path, size, output_path))
+        record_jobs.append((kind, item_id, thumb_jobs))
+
+    # Records share no inputs or outputs, so their thumbnails are encoded concurrently.
+    # Results are still reported in plan order. The first failure cancels queued records;
+    # records already running are drained, their successes reported as generated and any
+    # further failures listed after the first.
+    if record_jobs:
+        failures: list[tuple[str, str, int, str]] = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(THUMBNAIL_ONLY_MAX_WORKERS, len(record_jobs))
+        ) as executor:
+            futures = [executor.submit(run_record_thumb_jobs, thumb_jobs) for _kind, _item_id, thumb_jobs in record_jobs]
+            for (kind, item_id, _thumb_jobs), future in zip(record_jobs, futures):
+                if future.cancelled():
+                    continue
+                exit_code, stderr_tail = future.result()
+                if exit_code == 0:
+                    generated[kind].append(item_id)
+                    continue
+                if not failures:
+                    for queued in futures:
+                        queued.cancel()
+                failures.append((kind, item_id, exit_code, stderr_tail))
+        if failures:
+            kind, item_id, exit_code, stderr_tail = failures[0]
+            summary = f"Thumbnail regeneration failed for {kind} {item_id}."
+            if len(failures) > 1:
+                also_failed = "; ".join(
+                    f"{other_kind} {other_id} (exit {other_code})" for other_kind, other_id, other_code, _tail in failures[1:]
+                )
+                summary = f"{summary} {len(failures) - 1} more record(s) also failed: {also_failed}."
+            return {
+                "label": "Regenerate Catalogue Thumbnails",
+                "status": "failed",
+                "summary": summary,
+                "generated": generated,
+                "planned": planned,
+                "current": current,
+                "skipped": skipped,
+                "exit_code": exit_code,
+                "stderr_tail": stderr_tail,
+            }
 
     summary_parts: list[str] = []
     generated_total = sum(len(values) for values in generated.values())
@@ -790,6 +881,78 @@ def run_ffmpeg_primary(src: Path, width: int, dest: Path) -> tuple[int, str]:
     return proc.returncode, (proc.stderr or proc.stdout or "").strip()
 
 
+def stage_media_sources(copies: Sequence[tuple[int, Path, Path]]) -> Iterator[tuple[int, Path]]:
+    """
+    Copy (task_index, source, staged) entries into staging a few items ahead of the caller,
+    yielding (task_index, staged) pairs in order so callers can check each copy is their own.
+    Sources often sit on latency-bound synced storage, so copies overlap the caller's encodes; at most
+    MEDIA_STAGE_MAX_WORKERS run ahead, closing early cancels the rest, and copy2 failures raise.
+    """
+
+    def stage_one(copy: tuple[int, Path, Path]) -> tuple[int, Path]:
+        task_index, source, staged = copy
+        staged.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy2(source, staged)
+        return task_index, staged
+
+    pending_copies = iter(copies)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MEDIA_STAGE_MAX_WORKERS) as executor:
+        in_flight = collections.deque(
+            executor.submit(stage_one, copy) for copy in itertools.islice(pending_copies, MEDIA_STAGE_MAX_WORKERS)
+        )
+        try:
+            while in_flight:
+                staged = in_flight.popleft().result()
+                next_copy = next(pending_copies, None)
+                if next_copy is not None:
+                    in_flight.append(executor.submit(stage_one, next_copy))
+                yield staged
+        finally:
+            for queued in in_flight:
+                queued.cancel()
+
+
+def run_record_thumb_jobs(jobs: Sequence[tuple[FfmpegRunner, Path, int, Path]]) -> tuple[int, str]:
+    """Encode one record's thumbnails in order, stopping at the first failure."""
+    for runner, src, size, dest in jobs:
+        exit_code, stderr_tail = runner(src, size, dest)
+        if exit_code != 0:
+            return exit_code, stderr_tail
+    return 0, ""
+
+
+def run_ffmpeg_jobs(jobs: Sequence[tuple[FfmpegRunner, Path, int, Path]]) -> tuple[int, int, str] | None:
+    """
+    Run one media item's encodes and return (job_index, exit_code, stderr_tail) for the first failure.
+    The first job runs alone, so a bad source fails once rather than in every encode; the rest run
+    concurrently and the first non-zero exit cancels any that have not started.
+    """
+    if not jobs:
+        return None
+    runner, src, size, dest = jobs[0]
+    exit_code, stderr_tail = runner(src, size, dest)
+    if exit_code != 0:
+        return 0, exit_code, stderr_tail
+    if len(jobs) == 1:
+        return None
+    failures: list[tuple[int, int, str]] = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(MEDIA_ENCODE_MAX_WORKERS, len(jobs) - 1)) as executor:
+        futures = {
+            executor.submit(runner, src, size, dest): job_index
+            for job_index, (runner, src, size, dest) in enumerate(jobs[1:], start=1)
+        }
+        for future in concurrent.futures.as_completed(futures):
+            if future.cancelled():
+                continue
+            exit_code, stderr_tail = future.result()
+            if exit_code != 0:
+                if not failures:
+                    for queued in futures:
+                        queued.cancel()
+                failures.append((futures[future], exit_code, stderr_tail))
+    return min(failures) if failures else None
+
+
 def execute_local_media_plan(
     repo_root: Path,
     *,
@@ -841,67 +1004,80 @@ def execute_local_media_plan(
     cleaned_staged_thumbs: Dict[str, list[str]] = {"work": [], "work_details": []}
     messages: list[str] = []
 
-    for task in tasks:
-        kind = str(task.get("kind") or "")
-        item_id = str(task.get("id") or "")
-        status = str(task.get("status") or "")
-        if status == "current":
-            current[kind].append(item_id)
-            continue
-        if status in {"blocked", "unavailable"}:
-            blocked[kind].append(item_id)
-            reason = str(task.get("reason") or "").strip()
-            if reason:
+    # Sources are staged lazily, each just before its item's encodes, with a small look-ahead;
+    # an early failure therefore leaves at most that look-ahead staged but not encoded.
+    staged_sources = stage_media_sources(
+        [
+            (
+                task_index,
+                Path(str(task.get("source_abs_path"))),
+                Path(str(task.get("staged_source_abs_path") or "")),
+            )
+            for task_index, task in enumerate(tasks)
+            if write
+            and task.get("status") == "pending"
+            and bool(task.get("pending_staged_source"))
+            and str(task.get("source_abs_path") or "").strip()
+        ]
+    )
+    with contextlib.closing(staged_sources):
+        for task_index, task in enumerate(tasks):
+            kind = str(task.get("kind") or "")
+            item_id = str(task.get("id") or "")
+            status = str(task.get("status") or "")
+            if status == "current":
+                current[kind].append(item_id)
+                continue
+            if status in {"blocked", "unavailable"}:
+                blocked[kind].append(item_id)
+                reason = str(task.get("reason") or "").strip()
+                if reason:
+                    messages.append(f"{kind} {item_id}: {reason}")
+                continue
+            if status != "pending":
+                continue
+            if not write:
+                planned[kind].append(item_id)
+                continue
+            # Plan builders emit resolved absolute paths, so they are used as-is here.
+            actual_source = Path(str(task.get("source_abs_path") or "")) if str(task.get("source_abs_path") or "").strip() else None
+            if actual_source is None:
+                reason = str(task.get("reason") or "missing source path").strip()
+                blocked[kind].append(item_id)
                 messages.append(f"{kind} {item_id}: {reason}")
-            continue
-        if status != "pending":
-            continue
-        if not write:
-            planned[kind].append(item_id)
-            continue
-        actual_source = Path(str(task.get("source_abs_path") or "")).resolve() if str(task.get("source_abs_path") or "").strip() else None
-        if actual_source is None:
-            reason = str(task.get("reason") or "missing source path").strip()
-            blocked[kind].append(item_id)
-            messages.append(f"{kind} {item_id}: {reason}")
-            continue
-        staged_source = Path(str(task.get("staged_source_abs_path") or "")).resolve()
-        if bool(task.get("pending_staged_source")):
-            staged_source.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(actual_source, staged_source)
-        if not staged_source.exists():
-            blocked[kind].append(item_id)
-            messages.append(f"{kind} {item_id}: staged source copy failed")
-            continue
-        pending_thumb_outputs = task.get("pending_thumb_outputs") if isinstance(task.get("pending_thumb_outputs"), list) else []
-        for output_spec in pending_thumb_outputs:
-            output_path = Path(str(output_spec.get("absolute_path") or "")).resolve()
-            size = int(output_spec.get("size") or THUMB_SIZES[0])
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            exit_code, stderr_tail = run_thumb(staged_source, size, output_path)
-            if exit_code != 0:
-                return {
-                    "label": "Generate Local Media Derivatives",
-                    "status": "failed",
-                    "summary": f"Local media generation failed for {kind} {item_id}.",
-                    "generated": generated,
-                    "planned": planned,
-                    "current": current,
-                    "blocked": blocked,
-                    "exit_code": exit_code,
-                    "stderr_tail": stderr_tail,
-                }
-        pending_primary_outputs = task.get("pending_primary_outputs") if isinstance(task.get("pending_primary_outputs"), list) else []
-        for output_spec in pending_primary_outputs:
-            output_path = Path(str(output_spec.get("absolute_path") or "")).resolve()
-            width = int(output_spec.get("width") or PRIMARY_WIDTHS[-1])
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            exit_code, stderr_tail = run_primary(staged_source, width, output_path)
-            if exit_code != 0:
+                continue
+            staged_source = Path(str(task.get("staged_source_abs_path") or ""))
+            if bool(task.get("pending_staged_source")):
+                # copy2 raises on failure, so a fresh copy needs no existence re-check.
+                staged_index, staged_source = next(staged_sources, (None, staged_source))
+                if staged_index != task_index:
+                    raise RuntimeError(f"Staged source order mismatch for {kind} {item_id}")
+            elif not staged_source.exists():
+                blocked[kind].append(item_id)
+                messages.append(f"{kind} {item_id}: staged source copy failed")
+                continue
+            encode_jobs: list[tuple[FfmpegRunner, Path, int, Path]] = []
+            pending_thumb_outputs = task.get("pending_thumb_outputs") if isinstance(task.get("pending_thumb_outputs"), list) else []
+            for output_spec in pending_thumb_outputs:
+                output_path = Path(str(output_spec.get("absolute_path") or ""))
+                size = int(output_spec.get("size") or THUMB_SIZES[0])
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                encode_jobs.append((run_thumb, staged_source, size, output_path))
+            thumb_job_count = len(encode_jobs)
+            pending_primary_outputs = task.get("pending_primary_outputs") if isinstance(task.get("pending_primary_outputs"), list) else []
+            for output_spec in pending_primary_outputs:
+                output_path = Path(str(output_spec.get("absolute_path") or ""))
+                width = int(output_spec.get("width") or PRIMARY_WIDTHS[-1])
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                encode_jobs.append((run_primary, staged_source, width, output_path))
+            encode_failure = run_ffmpeg_jobs(encode_jobs)
+            if encode_failure is not None:
+                job_index, exit_code, stderr_tail = encode_failure
+                failed_output = "media" if job_index < thumb_job_count else "primary media"
                 return {
                     "label": "Generate Local Media Derivatives",
                     "status": "failed",
-                    "summary": f"Local primary media generation failed for {kind} {item_id}.",
+                    "summary": f"Local {failed_output} generation failed for {kind} {item_id}.",
                     "generated": generated,
                     "planned": planned,
                     "current": current,
@@ -909,33 +1085,33 @@ def execute_local_media_plan(
                     "exit_code": exit_code,
                     "stderr_tail": stderr_tail,
                 }
-        pending_asset_thumbs = task.get("pending_asset_thumbs") if isinstance(task.get("pending_asset_thumbs"), list) else []
-        for output_spec in pending_asset_thumbs:
-            staged_thumb = Path(str(output_spec.get("staged_absolute_path") or "")).resolve()
-            output_path = Path(str(output_spec.get("absolute_path") or "")).resolve()
-            if not staged_thumb.exists():
-                staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
-                return {
-                    "label": "Generate Local Media Derivatives",
-                    "status": "failed",
-                    "summary": f"Local thumbnail staging failed for {kind} {item_id}.",
-                    "generated": generated,
-                    "planned": planned,
-                    "current": current,
-                    "blocked": blocked,
-                    "exit_code": 1,
-                    "stderr_tail": f"missing staged thumbnail: {staged_thumb_display}",
-                }
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(staged_thumb, output_path)
-            try:
-                staged_thumb.unlink()
-                staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
-                cleaned_staged_thumbs[kind].append(staged_thumb_display)
-            except OSError as exc:
-                staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
-                messages.append(f"{kind} {item_id}: could not remove staged thumbnail {staged_thumb_display}: {exc}")
-        generated[kind].append(item_id)
+            pending_asset_thumbs = task.get("pending_asset_thumbs") if isinstance(task.get("pending_asset_thumbs"), list) else []
+            for output_spec in pending_asset_thumbs:
+                staged_thumb = Path(str(output_spec.get("staged_absolute_path") or ""))
+                output_path = Path(str(output_spec.get("absolute_path") or ""))
+                if not staged_thumb.exists():
+                    staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
+                    return {
+                        "label": "Generate Local Media Derivatives",
+                        "status": "failed",
+                        "summary": f"Local thumbnail staging failed for {kind} {item_id}.",
+                        "generated": generated,
+                        "planned": planned,
+                        "current": current,
+                        "blocked": blocked,
+                        "exit_code": 1,
+                        "stderr_tail": f"missing staged thumbnail: {staged_thumb_display}",
+                    }
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(staged_thumb, output_path)
+                try:
+                    staged_thumb.unlink()
+                    staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
+                    cleaned_staged_thumbs[kind].append(staged_thumb_display)
+                except OSError as exc:
+                    staged_thumb_display = str(output_spec.get("staged_path") or repo_relative_path(staged_thumb, repo_root))
+                    messages.append(f"{kind} {item_id}: could not remove staged thumbnail {staged_thumb_display}: {exc}")
+            generated[kind].append(item_id)
 
     summary_parts: list[str] = []
     generated_total = sum(len(values) for values in generated.values())
@@ -1031,12 +1207,13 @@ def build_readiness_item(
 
 def build_work_readiness(records: Any, work_id: str, *, env: Dict[str, str] | None = None) -> Dict[str, Any]:
     repo_root = detect_repo_root()
-    projects_base_dir, availability_error = detect_projects_base_dir_optional(env)
+    projects_base = detect_projects_base_dir_optional(env)
+    projects_base_dir, availability_error = projects_base
     work_record = records.works.get(work_id)
     if not isinstance(work_record, dict):
         raise ValueError(f"work_id not found: {work_id}")
 
-    media_path, media_missing_reason, _, _ = resolve_work_media_source(records, work_id, env=env)
+    media_path, media_missing_reason, _, _ = resolve_work_media_source(records, work_id, env=env, projects_base=projects_base)
     items = [
         build_media_readiness_item(
             repo_root=repo_root,
@@ -1063,11 +1240,12 @@ def build_series_readiness(records: Any, series_id: str, *, env: Dict[str, str]
 
 def build_detail_readiness(records: Any, detail_uid: str, *, env: Dict[str, str] | None = None) -> Dict[str, Any]:
     repo_root = detect_repo_root()
-    projects_base_dir, availability_error = detect_projects_base_dir_optional(env)
+    projects_base = detect_projects_base_dir_optional(env)
+    projects_base_dir, availability_error = projects_base
     detail_record = records.work_details.get(detail_uid)
     if not isinstance(detail_record, dict):
         raise ValueError(f"detail_uid not found: {detail_uid}")
-    media_path, media_missing_reason, _, _ = resolve_detail_media_source(records, detail_uid, env=env)
+    media_path, media_missing_reason, _, _ = resolve_detail_media_source(records, detail_uid, env=env, projects_base=projects_base)
 
     items = [
         build_media_readiness_item(
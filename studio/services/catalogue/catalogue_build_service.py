@@ -142,9 +142,11 @@ def run_build_operation(
 
 
 def run_catalogue_search_rebuild(repo_root: Path, *, write: bool) -> dict[str, Any]:
+    env = runtime_env(repo_root=repo_root)
     proc = subprocess.run(
-        build_search_command(repo_root, write=write, force=False, env=runtime_env(repo_root=repo_root)),
+        build_search_command(repo_root, write=write, force=False, env=env),
         cwd=repo_root,
+        env=env,
         text=True,
         capture_output=True,
         check=False,
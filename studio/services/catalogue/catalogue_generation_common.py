@@ -7,9 +7,15 @@ import hashlib
 import json
 import math
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 
+ID_DOT_ZERO_SUFFIX_PATTERN = re.compile(r"\.0$")
+ID_NON_DIGIT_PATTERN = re.compile(r"\D")
+DIGIT_RUN_PATTERN = re.compile(r"\d+")
+
+
 def normalize_text(value: Any) -> str:
     """Normalize source text by trimming and stripping a leading apostrophe prefix."""
     if value is None:
@@ -20,21 +26,42 @@ def normalize_text(value: Any) -> str:
     return s
 
 
-def slug_id(raw: Any, width: int = 5) -> str:
-    """Normalize numeric catalogue ids to zero-padded digit strings."""
+def _build_slug_id(raw: Any, width: int) -> str:
     if raw is None:
         raise ValueError("Missing id")
+    if type(raw) is int and raw >= 0:
+        return str(raw).zfill(width)
     s = normalize_text(raw)
-    s = re.sub(r"\.0$", "", s)
-    s = re.sub(r"\D", "", s)
+    s = ID_DOT_ZERO_SUFFIX_PATTERN.sub("", s)
+    s = ID_NON_DIGIT_PATTERN.sub("", s)
     if not s:
         raise ValueError(f"Invalid id value: {raw!r}")
     return s.zfill(width)
 
 
+# The same raw ids recur across the importer, validation and generation passes; cache the
+# str/int cases only. typed=True keeps 1 and "1" as separate cache entries; floats and
+# other values bypass the cache.
+_cached_slug_id = lru_cache(maxsize=65536, typed=True)(_build_slug_id)
+
+
+def slug_id(raw: Any, width: int = 5) -> str:
+    """Normalize numeric catalogue ids to zero-padded digit strings."""
+    if isinstance(raw, (str, int)):
+        return _cached_slug_id(raw, width)
+    return _build_slug_id(raw, width)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_status_text(value: str) -> str:
+    return normalize_text(value).lower()
+
+
 def normalize_status(value: Any) -> str:
     if value is None:
         return ""
+    if isinstance(value, str):
+        return _normalize_status_text(value)
     return normalize_text(value).lower()
 
 
@@ -46,7 +73,7 @@ def numeric_aware_sort_key(value: Any, width: int = 3) -> str:
     s = normalize_text(value)
     if not s:
         return ""
-    return re.sub(r"\d+", lambda m: m.group(0).zfill(width), s)
+    return DIGIT_RUN_PATTERN.sub(lambda m: m.group(0).zfill(width), s)
 
 
 def parse_date(raw: Any) -> Optional[str]:
@@ -78,8 +105,9 @@ def parse_list(raw: Any, sep: str = ",") -> List[str]:
 def is_empty(value: Any) -> bool:
     if value is None:
         return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
+    if isinstance(value, str):
+        # isspace() matches what strip() removes without allocating a stripped copy.
+        return not value or value.isspace()
     return False
 
 
@@ -139,15 +167,18 @@ def canonicalize_for_hash(value: Any) -> Any:
     return value
 
 
+# canonicalize_for_hash already emits str keys in sorted order, so the shared
+# encoder does not need sort_keys.
+_CANONICAL_HASH_ENCODER = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    allow_nan=False,
+)
+
+
 def compute_payload_hash_hex(payload: Any) -> str:
     """Compute deterministic blake2b hex hash for a canonicalized payload."""
-    canonical = json.dumps(
-        canonicalize_for_hash(payload),
-        sort_keys=True,
-        ensure_ascii=False,
-        separators=(",", ":"),
-        allow_nan=False,
-    ).encode("utf-8")
+    canonical = _CANONICAL_HASH_ENCODER.encode(canonicalize_for_hash(payload)).encode("utf-8")
     return hashlib.blake2b(canonical, digest_size=16).hexdigest()
 
 
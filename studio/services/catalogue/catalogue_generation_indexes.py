@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, Dict, List, Mapping, Optional
 
 try:
@@ -95,40 +98,48 @@ def build_series_work_index_context(
         if title is not None:
             series_title_by_id[sid] = title
 
-    series_project_folders_by_id: Dict[str, List[str]] = {}
-    project_folder_sets_by_series: Dict[str, set[str]] = {}
-    for work_record in work_records.values():
-        folder = coerce_string(work_record.get("project_folder"))
-        series_ids = records.parse_work_record_series_ids(work_record)
-        if not series_ids or folder is None:
-            continue
-        for sid in series_ids:
-            project_folder_sets_by_series.setdefault(sid, set()).add(folder)
-    for sid, folder_set in project_folder_sets_by_series.items():
-        series_project_folders_by_id[sid] = sorted(folder_set, key=lambda value: value.lower())
-
-    works_sortable_fields = {fm_key for fm_key, _, _ in records.WORKS_SCHEMA}
-    works_sortable_fields.update({"work_id", "series_title", "title_sort"})
-    numeric_sort_fields = {"year", "height_cm", "width_cm", "depth_cm"}
+    # One pass over works collects project folders, projections and series membership.
+    # Membership is gathered as (series_id, work_id) pairs and sorted once.
+    parse_series_ids = records.parse_work_record_series_ids
+    build_projection = records.build_work_record_projection
+    project_folder_sets_by_series: defaultdict[str, set[str]] = defaultdict(set)
+    series_work_pairs: List[tuple[str, str]] = []
     work_meta_by_id: Dict[str, Dict[str, Any]] = {}
     work_status_by_id: Dict[str, str] = {}
-    work_ids_by_series_all: Dict[str, List[str]] = {}
     for work_record in work_records.values():
+        series_ids = parse_series_ids(work_record)
+        folder = coerce_string(work_record.get("project_folder"))
+        if folder is not None:
+            for sid in series_ids:
+                project_folder_sets_by_series[sid].add(folder)
+
         wid_raw = work_record.get("work_id")
         if is_empty(wid_raw):
             continue
         wid = slug_id(wid_raw)
-        meta = records.build_work_record_projection(work_record)
+        meta = build_projection(work_record)
         work_status_by_id[wid] = normalize_status(work_record.get("status"))
-        series_ids = records.parse_work_record_series_ids(work_record)
         sid = series_ids[0] if series_ids else ""
         meta["work_id"] = wid
         meta["series_ids"] = series_ids
         meta["series_id"] = sid
         meta["series_title"] = series_title_by_id.get(sid) if sid else None
         work_meta_by_id[wid] = meta
-        for series_id in series_ids:
-            work_ids_by_series_all.setdefault(series_id, []).append(wid)
+        series_work_pairs.extend((series_id, wid) for series_id in series_ids)
+
+    series_project_folders_by_id: Dict[str, List[str]] = {
+        sid: sorted(folder_set, key=lambda value: value.lower())
+        for sid, folder_set in project_folder_sets_by_series.items()
+    }
+    series_work_pairs.sort()
+    work_ids_by_series_all: Dict[str, List[str]] = {
+        sid: [wid for _, wid in pairs]
+        for sid, pairs in groupby(series_work_pairs, key=itemgetter(0))
+    }
+
+    works_sortable_fields = {fm_key for fm_key, _, _ in records.WORKS_SCHEMA}
+    works_sortable_fields.update({"work_id", "series_title", "title_sort"})
+    numeric_sort_fields = {"year", "height_cm", "width_cm", "depth_cm"}
 
     series_sort_by_series_id: Dict[str, Dict[str, str]] = {
         sid: {wid: wid for wid in work_ids}
@@ -208,19 +219,20 @@ def build_series_work_index_context(
 
 
 def ordered_published_work_ids_by_series(context: SeriesWorkIndexContext) -> Dict[str, List[str]]:
-    work_rows_by_series: Dict[str, List[tuple[str, str]]] = {}
+    # Bucket every published (series_id, series_sort, work_id) row, sort once, then group.
+    work_status_by_id = context.work_status_by_id
+    rows: List[tuple[str, str, str]] = []
     for sid, work_ids in context.work_ids_by_series_all.items():
+        series_sort = context.series_sort_by_series_id.get(sid, {})
         for wid in work_ids:
-            if context.work_status_by_id.get(wid) != "published":
+            if work_status_by_id.get(wid) != "published":
                 continue
-            series_sort = context.series_sort_by_series_id.get(sid, {}).get(wid, wid)
-            work_rows_by_series.setdefault(sid, []).append((series_sort, wid))
-
-    ordered: Dict[str, List[str]] = {}
-    for sid, rows in work_rows_by_series.items():
-        rows_sorted = sorted(rows, key=lambda item: (item[0], item[1]))
-        ordered[sid] = [wid for _, wid in rows_sorted]
-    return ordered
+            rows.append((sid, series_sort.get(wid, wid), wid))
+    rows.sort()
+    return {
+        sid: [wid for _, _, wid in series_rows]
+        for sid, series_rows in groupby(rows, key=itemgetter(0))
+    }
 
 
 def build_series_index_records(
@@ -113,12 +113,16 @@ def parse_work_record_series_ids(work_record: Mapping[str, Any]) -> List[str]:
     return series_ids
 
 
+_CHECKSUM_ENCODER = json.JSONEncoder(sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+
+
 def compute_work_checksum(record: Mapping[str, Any]) -> str:
     """Compute a deterministic checksum for a generated JSON record."""
-    payload = dict(record)
-    payload.pop("checksum", None)
+    payload = record
+    if "checksum" in record:
+        payload = {key: value for key, value in record.items() if key != "checksum"}
 
-    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    canonical = _CHECKSUM_ENCODER.encode(payload).encode("utf-8")
     h = hashlib.blake2b(canonical, digest_size=16)
     return h.hexdigest()
 
@@ -241,27 +245,25 @@ def build_work_json_payload(
         raise ValueError("work.doc_url must be an array")
     public_record["doc_url"] = normalize_document_urls(raw_doc_urls)
     public_sections = [dict(section) for section in sections]
-    version_input = compact_json_object(
+    # The compacted body is both the version input and the payload body, so it is
+    # compacted and hashed once.
+    body = compact_json_object(
         {
             "work": public_record,
             "sections": public_sections,
             "content_html": content_html,
         }
     )
-    return compact_json_object(
+    header = compact_json_object(
         {
-            "header": {
-                "schema": WORK_RECORD_SCHEMA_VERSION,
-                "version": compute_payload_version(version_input),
-                "generated_at_utc": generated_at_utc,
-                "work_id": work_id,
-                "count": count,
-            },
-            "work": public_record,
-            "sections": public_sections,
-            "content_html": content_html,
+            "schema": WORK_RECORD_SCHEMA_VERSION,
+            "version": compute_payload_version(body),
+            "generated_at_utc": generated_at_utc,
+            "work_id": work_id,
+            "count": count,
         }
     )
+    return {"header": header, **body}
 
 
 def build_series_json_payload(
@@ -279,33 +281,30 @@ def build_series_json_payload(
     if not isinstance(raw_doc_urls, list):
         raise ValueError("series.doc_url must be an array")
     public_record["doc_url"] = normalize_document_urls(raw_doc_urls)
-    version_input = compact_json_object(
+    body = compact_json_object(
         {
             "series": public_record,
             "content_html": content_html,
-            "work_count": count,
         }
     )
-    return compact_json_object(
+    header = compact_json_object(
         {
-            "header": {
-                "schema": SERIES_RECORD_SCHEMA_VERSION,
-                "version": compute_payload_version(version_input),
-                "generated_at_utc": generated_at_utc,
-                "series_id": series_id,
-                "count": count,
-            },
-            "series": public_record,
-            "content_html": content_html,
+            "schema": SERIES_RECORD_SCHEMA_VERSION,
+            "version": compute_payload_version({**body, "work_count": count}),
+            "generated_at_utc": generated_at_utc,
+            "series_id": series_id,
+            "count": count,
         }
     )
+    return {"header": header, **body}
 
 
 def build_sections_from_detail_sections(detail_sections: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
     sections: List[Dict[str, Any]] = []
     for section in detail_sections:
         detail_records = section.get("details")
-        details = [dict(detail) for detail in detail_records] if isinstance(detail_records, list) else []
+        # compact_json_object rebuilds every nested dict, so the details need no defensive copy here.
+        details = detail_records if isinstance(detail_records, list) else []
         sections.append(
             compact_json_object(
                 {
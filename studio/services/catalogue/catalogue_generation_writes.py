@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
-"""Pure write-decision helpers for generated catalogue artifacts."""
+"""Write-decision helpers and the atomic JSON writer for generated catalogue artifacts."""
 
 from __future__ import annotations
 
 import json
+import os
+import re
+import stat
+import tempfile
 from dataclasses import dataclass
-from typing import Any, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
 
 
 ROUTE_EXISTS = "route_exists"
 VERSION_MATCH = "version_match"
+LEADING_HEADER_PATTERN = re.compile(r'\A\s*\{\s*"header"\s*:\s*')
+_HEADER_DECODER = json.JSONDecoder()
 
 
 @dataclass(frozen=True)
@@ -34,16 +42,68 @@ def decide_route_stub_write(*, path_exists: bool, force: bool) -> GeneratedWrite
     return GeneratedWriteDecision(should_write=True, overwrite=path_exists)
 
 
-def extract_header_scalar_from_json_text(text: str, key: str) -> Optional[str]:
+def json_payload_bytes(payload: Mapping[str, Any]) -> bytes:
+    """Serialize a generated payload as 2-space indented UTF-8 JSON with a trailing newline.
+
+    Always the stdlib encoder, so tracked output bytes do not depend on which optional
+    packages happen to be installed.
+    """
+    return (json.dumps(payload, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+@lru_cache(maxsize=1)
+def new_file_mode() -> int:
+    """Mode a plain open() would give a new file under the process umask."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def write_bytes_atomically(path: Path, data: bytes, *, skip_identical: bool = False) -> bool:
+    """
+    Replace `path` with `data` via a temp file and os.replace, keeping an existing file's mode.
+    With skip_identical, a file that already holds the bytes is left alone and False is returned.
+    """
     try:
-        obj = json.loads(text)
-    except Exception:
-        return None
-    if not isinstance(obj, dict):
+        existing_stat = path.stat()
+    except FileNotFoundError:
+        existing_stat = None
+    if skip_identical and existing_stat is not None and existing_stat.st_size == len(data):
+        try:
+            if path.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+    mode = stat.S_IMODE(existing_stat.st_mode) if existing_stat is not None else new_file_mode()
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    temp_path = Path(temp_name)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            os.fchmod(handle.fileno(), mode)
+            handle.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return True
+
+
+def decode_leading_header(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Decode the header object that generated payloads emit first.
+    Works on a truncated prefix of the file; returns None when no complete leading header is present.
+    """
+    match = LEADING_HEADER_PATTERN.match(text)
+    if match is None:
         return None
-    header = obj.get("header")
-    if not isinstance(header, dict):
+    try:
+        header, _end = _HEADER_DECODER.raw_decode(text, match.end())
+    except ValueError:
         return None
+    return header if isinstance(header, dict) else None
+
+
+def header_scalar(header: Mapping[str, Any], key: str) -> Optional[str]:
     value: Any = header.get(key)
     if value is None:
         return None
@@ -51,6 +111,22 @@ def extract_header_scalar_from_json_text(text: str, key: str) -> Optional[str]:
     return scalar or None
 
 
+def extract_header_scalar_from_json_text(text: str, key: str) -> Optional[str]:
+    # Generated payloads lead with their header, so decode just that object when possible.
+    header: Any = decode_leading_header(text)
+    if header is None:
+        try:
+            obj = json.loads(text)
+        except Exception:
+            return None
+        if not isinstance(obj, dict):
+            return None
+        header = obj.get("header")
+    if not isinstance(header, dict):
+        return None
+    return header_scalar(header, key)
+
+
 def decide_json_payload_write(
     *,
     path_exists: bool,
@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import shlex
 import subprocess
 import sys
 from pathlib import Path
@@ -115,10 +116,11 @@ def run_scoped_build_scope(
         failure_message = str(media_step.get("stderr_tail") or media_step.get("summary") or "Local media generation failed.")
 
     if status != "failed" and not media_only:
+        repo_root_text = str(repo_root)
         for label, cmd in commands:
             proc = subprocess.run(
                 cmd,
-                cwd=str(repo_root),
+                cwd=repo_root_text,
                 env=env,
                 text=True,
                 capture_output=True,
@@ -184,8 +186,10 @@ def print_preview(scope: Dict[str, Any], repo_root: Path, source_dir: Path, *, f
             print("Field-aware reasons:")
             for line in explanation_lines:
                 print(f"  - {line}")
+    # One env snapshot serves both the media plan and the search command preview.
+    env = runtime_env()
     media_plan = (
-        build_media.build_local_media_plan(repo_root, scope=scope, force=force)
+        build_media.build_local_media_plan(repo_root, scope=scope, env=env, force=force)
         if bool(scope.get("generate_local_media", True))
         else {"counts": {"pending": 0, "current": 0, "blocked": 0, "unavailable": 0}}
     )
@@ -214,11 +218,11 @@ def print_preview(scope: Dict[str, Any], repo_root: Path, source_dir: Path, *, f
             )
         )
     if bool(scope.get("rebuild_search")):
-        commands.append(build_commands.build_search_command(repo_root, write=False, force=bool(force), env=runtime_env()))
+        commands.append(build_commands.build_search_command(repo_root, write=False, force=bool(force), env=env))
     commands.append(build_commands.build_semantic_target_lookup_command(repo_root, write=False))
     if commands:
         for cmd in commands:
-            print("  + " + " ".join(cmd))
+            print("  + " + shlex.join(cmd))
     else:
         print("  (none)")
 
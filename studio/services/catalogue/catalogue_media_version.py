@@ -48,7 +48,7 @@ def _default_build_runner(command: Sequence[str], repo_root: Path, env: Mapping[
     result = subprocess.run(
         list(command),
         cwd=str(repo_root),
-        env=dict(env),
+        env=env,
         text=True,
         capture_output=True,
         check=False,
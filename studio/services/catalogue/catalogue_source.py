@@ -9,8 +9,12 @@ from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping
 
 try:
+    from catalogue.catalogue_generation_common import is_empty, normalize_status, normalize_text, slug_id
+    from catalogue.catalogue_generation_writes import json_payload_bytes, write_bytes_atomically
     from catalogue.series_ids import normalize_series_id, parse_series_ids
 except ModuleNotFoundError:  # pragma: no cover - package import fallback
+    from catalogue.catalogue_generation_common import is_empty, normalize_status, normalize_text, slug_id
+    from catalogue.catalogue_generation_writes import json_payload_bytes, write_bytes_atomically
     from catalogue.series_ids import normalize_series_id, parse_series_ids
 
 
@@ -267,33 +271,46 @@ def ordered_work_detail_sections(
     records: "CatalogueSourceRecords",
     work_id: str,
 ) -> list[Dict[str, Any]]:
-    sections_by_id = {
-        section_id: dict(section)
-        for section_id, section in records.work_detail_sections.items()
-        if normalize_text(section.get("work_id")) == work_id
-    }
-    details_by_section: Dict[str, list[Dict[str, Any]]] = {
-        section_id: []
-        for section_id in sections_by_id
-    }
+    return ordered_work_detail_sections_by_work(records, (work_id,)).get(work_id, [])
+
+
+def ordered_work_detail_sections_by_work(
+    records: "CatalogueSourceRecords",
+    work_ids: Iterable[str] | None = None,
+) -> Dict[str, list[Dict[str, Any]]]:
+    """Group ordered detail sections for many works in one pass over sections and details."""
+    wanted_work_ids = None if work_ids is None else set(work_ids)
+    sections_by_work: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for section_id, section in records.work_detail_sections.items():
+        section_work_id = normalize_text(section.get("work_id"))
+        if wanted_work_ids is not None and section_work_id not in wanted_work_ids:
+            continue
+        sections_by_work.setdefault(section_work_id, {})[section_id] = dict(section)
+
+    details_by_work_section: Dict[tuple[str, str], list[Dict[str, Any]]] = {}
     for detail_uid, detail in records.work_details.items():
-        if normalize_text(detail.get("work_id")) != work_id:
+        detail_work_id = normalize_text(detail.get("work_id"))
+        sections_by_id = sections_by_work.get(detail_work_id)
+        if sections_by_id is None:
             continue
         section_id = normalize_text(detail.get("section_id"))
         if section_id not in sections_by_id:
             continue
         detail_payload = dict(detail)
         detail_payload["detail_uid"] = normalize_text(detail_payload.get("detail_uid")) or detail_uid
-        details_by_section.setdefault(section_id, []).append(detail_payload)
+        details_by_work_section.setdefault((detail_work_id, section_id), []).append(detail_payload)
 
-    ordered_sections: list[Dict[str, Any]] = []
-    for section_id, section in sorted(sections_by_id.items(), key=lambda item: section_sort_key(item[1])):
-        details = details_by_section.get(section_id, [])
-        details.sort(key=lambda detail: detail_sort_key_for_section(section, detail))
-        section_payload = dict(section)
-        section_payload["details"] = details
-        ordered_sections.append(section_payload)
-    return ordered_sections
+    ordered_by_work: Dict[str, list[Dict[str, Any]]] = {}
+    for section_work_id, sections_by_id in sections_by_work.items():
+        ordered_sections: list[Dict[str, Any]] = []
+        for section_id, section in sorted(sections_by_id.items(), key=lambda item: section_sort_key(item[1])):
+            details = details_by_work_section.get((section_work_id, section_id), [])
+            details.sort(key=lambda detail: detail_sort_key_for_section(section, detail))
+            section_payload = dict(section)
+            section_payload["details"] = details
+            ordered_sections.append(section_payload)
+        ordered_by_work[section_work_id] = ordered_sections
+    return ordered_by_work
 
 
 def normalize_detail_sort_value(value: Any) -> str | None:
@@ -332,38 +349,6 @@ class CatalogueSourceRecords:
         }
 
 
-def normalize_text(value: Any) -> str:
-    if value is None:
-        return ""
-    text = str(value).strip()
-    if text.startswith("'") and len(text) > 1:
-        text = text[1:]
-    return text
-
-
-def normalize_status(value: Any) -> str:
-    return normalize_text(value).lower()
-
-
-def is_empty(value: Any) -> bool:
-    if value is None:
-        return True
-    if isinstance(value, str) and value.strip() == "":
-        return True
-    return False
-
-
-def slug_id(raw: Any, width: int = 5) -> str:
-    if raw is None:
-        raise ValueError("Missing id")
-    text = normalize_text(raw)
-    text = re.sub(r"\.0$", "", text)
-    text = re.sub(r"\D", "", text)
-    if not text:
-        raise ValueError(f"Invalid id value: {raw!r}")
-    return text.zfill(width)
-
-
 def normalize_series_ids_value(value: Any) -> list[str]:
     if value is None:
         return []
@@ -385,7 +370,7 @@ def normalize_detail_uid_value(value: Any) -> str:
     if not text:
         raise ValueError("detail_uid is required")
     if "-" in text:
-        raw_work_id, raw_detail_id = text.split("-", 1)
+        raw_work_id, _separator, raw_detail_id = text.partition("-")
     else:
         digits = "".join(ch for ch in text if ch.isdigit())
         if len(digits) != 8:
@@ -649,7 +634,7 @@ def flatten_work_detail_record_payload(path: Path, payload: Mapping[str, Any]) -
             detail_uid = normalize_text(detail_record.get("detail_uid"))
             if not detail_uid:
                 raise ValueError(f"Invalid source file {path}: detail missing detail_uid")
-            if normalize_detail_uid_value(detail_uid).split("-", 1)[0] != work_id:
+            if normalize_detail_uid_value(detail_uid).partition("-")[0] != work_id:
                 raise ValueError(f"Invalid source file {path}: detail_uid {detail_uid!r} does not belong to {work_id}")
             detail_records[detail_uid] = detail_record
     return section_records, detail_records
@@ -683,12 +668,21 @@ def payloads_from_records(records: CatalogueSourceRecords) -> Dict[str, Dict[str
     return payloads
 
 
+def write_source_json_file(path: Path, payload: Mapping[str, Any]) -> bool:
+    """
+    Replace a canonical source JSON file atomically; returns False when it already holds the bytes.
+    The payload is serialized before anything touches disk, so an unserializable value or an
+    interrupted write leaves the existing source file intact.
+    """
+    return write_bytes_atomically(path, json_payload_bytes(payload), skip_identical=True)
+
+
 def write_payloads(source_dir: Path, payloads: Mapping[str, Mapping[str, Any]]) -> list[Path]:
     source_dir.mkdir(parents=True, exist_ok=True)
     written: list[Path] = []
     for kind in ["works", "series"]:
         path = source_dir / SOURCE_FILES[kind]
-        path.write_text(json.dumps(payloads[kind], ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        write_source_json_file(path, payloads[kind])
         written.append(path)
     details_payload = payloads.get("work_details")
     if isinstance(details_payload, Mapping):
@@ -727,7 +721,7 @@ def write_source_record_payloads(
             continue
         path = source_dir / SOURCE_FILES[kind]
         payload = payload_for_map(kind, record_maps[kind])
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        write_source_json_file(path, payload)
         written.append(path)
     return written
 
@@ -748,7 +742,7 @@ def write_work_detail_payloads(
             stale_path.unlink()
     written: list[Path] = []
     for path, payload in payloads.items():
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        write_source_json_file(path, payload)
         written.append(path)
     return written
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping
 
@@ -63,8 +64,11 @@ DEFAULT_IMPORT_WORKBOOK_PATH = bulk_import_workbook_path(PIPELINE_CONFIG)
 IMPORT_MODE_WORKS = "works"
 IMPORT_MODE_WORK_DETAILS = "work_details"
 VALID_IMPORT_MODES = {IMPORT_MODE_WORKS, IMPORT_MODE_WORK_DETAILS}
+IMPORT_SHEET_BY_MODE = {IMPORT_MODE_WORKS: "Works", IMPORT_MODE_WORK_DETAILS: "WorkDetails"}
 PREVIEW_SAMPLE_LIMIT = 20
 BLOCKED_SAMPLE_LIMIT = 40
+# Preview and apply read the same sheet back to back; keep a few parsed sheets per process.
+WORKBOOK_SHEET_CACHE_SIZE = 4
 
 
 @dataclass(frozen=True)
@@ -106,11 +110,11 @@ def normalize_import_mode(raw_mode: Any) -> str:
 def build_workbook_import_plan(source_dir: Path, workbook_path: Path, mode: str) -> WorkbookImportPlan:
     normalized_mode = normalize_import_mode(mode)
     source_records = records_from_json_source(source_dir)
-    workbook = _load_workbook(workbook_path)
+    rows, headers = _read_workbook_sheet(workbook_path, IMPORT_SHEET_BY_MODE[normalized_mode])
 
     if normalized_mode == IMPORT_MODE_WORKS:
-        return _build_work_import_plan(source_records, workbook, workbook_path)
-    return _build_work_detail_import_plan(source_records, workbook, workbook_path)
+        return _build_work_import_plan(source_records, rows, headers, workbook_path)
+    return _build_work_detail_import_plan(source_records, rows, headers, workbook_path)
 
 
 def apply_workbook_import_plan(source_dir: Path, plan: WorkbookImportPlan) -> CatalogueSourceRecords:
@@ -241,14 +245,59 @@ def cell(row: tuple[Any, ...], headers: Mapping[str, int], name: str) -> Any:
     return row[idx]
 
 
+def column_indices(headers: Mapping[str, int], names: Iterable[str]) -> list[tuple[str, int | None]]:
+    """Resolve column indexes once per sheet for fields copied from every row."""
+    return [(name, headers.get(name)) for name in names]
+
+
+def cell_at(row: tuple[Any, ...], idx: int | None) -> Any:
+    if idx is None or idx >= len(row):
+        return None
+    return row[idx]
+
+
+def _read_workbook_sheet(workbook_path: Path, sheet_name: str) -> tuple[list[tuple[Any, ...]], Dict[str, int]]:
+    """Return one sheet's rows and header map, reusing the parse while the workbook file is unchanged."""
+    resolved_path = workbook_path.expanduser().resolve()
+    try:
+        stat = resolved_path.stat()
+    except FileNotFoundError:
+        raise ValueError(f"Workbook not found: {resolved_path}") from None
+    rows, headers = _read_workbook_sheet_cached(str(resolved_path), stat.st_mtime_ns, stat.st_size, sheet_name)
+    return list(rows), dict(headers)
+
+
+@lru_cache(maxsize=WORKBOOK_SHEET_CACHE_SIZE)
+def _read_workbook_sheet_cached(
+    workbook_path: str,
+    mtime_ns: int,
+    size: int,
+    sheet_name: str,
+) -> tuple[tuple[tuple[Any, ...], ...], Dict[str, int]]:
+    # mtime_ns and size are part of the cache key only, so an edited workbook is parsed again.
+    workbook = _load_workbook(Path(workbook_path))
+    try:
+        rows, headers = _require_sheet(workbook, sheet_name)
+    finally:
+        workbook.close()
+    return tuple(rows), headers
+
+
 def _require_sheet(wb, sheet_name: str) -> tuple[list[tuple[Any, ...]], Dict[str, int]]:
     if sheet_name not in wb.sheetnames:
         raise ValueError(f"Sheet not found in workbook: {sheet_name}")
     ws = wb[sheet_name]
-    rows = list(ws.iter_rows(values_only=True))
-    if not rows:
+    # Some exporters write a bogus <dimension> (e.g. A1:XFD1048576); read-only sheets would
+    # otherwise pad every row out to it. Re-derive the bounds from the cells actually present.
+    ws.reset_dimensions()
+    header_row = next(ws.iter_rows(max_row=1, values_only=True), None)
+    if header_row is None:
         raise ValueError(f"Sheet is empty: {sheet_name}")
-    return rows, header_map(rows[0])
+    headers = header_map(header_row)
+    # Cells right of the last named header can never be looked up, so stop each row there.
+    max_col = max(headers.values()) + 1 if headers else None
+    rows = list(ws.iter_rows(max_col=max_col, values_only=True))
+    return rows, headers
 
 
 def _sample_ids(ids: Iterable[str]) -> list[str]:
@@ -283,8 +332,12 @@ def _append_blocked(
     reason_counts[reason] = reason_counts.get(reason, 0) + 1
 
 
-def _build_work_import_plan(source_records: CatalogueSourceRecords, workbook, workbook_path: Path) -> WorkbookImportPlan:
-    rows, headers = _require_sheet(workbook, "Works")
+def _build_work_import_plan(
+    source_records: CatalogueSourceRecords,
+    rows: list[tuple[Any, ...]],
+    headers: Mapping[str, int],
+    workbook_path: Path,
+) -> WorkbookImportPlan:
     _require_headers(headers, ["work_id", "series_ids", "title"], sheet_name="Works")
 
     importable: Dict[str, Dict[str, Any]] = {}
@@ -294,11 +347,24 @@ def _build_work_import_plan(source_records: CatalogueSourceRecords, workbook, wo
     seen_work_ids: set[str] = set()
     total_candidate_rows = 0
     known_series_ids = set(source_records.series.keys())
+    copied_field_columns = column_indices(
+        headers,
+        [
+            field_name
+            for field_name in WORK_FIELDS
+            if field_name not in {"work_id", "status", "published_date", "series_ids"}
+        ],
+    )
+
+    # Resolve key columns once; rows are then read positionally.
+    work_id_idx = headers.get("work_id")
+    title_idx = headers.get("title")
+    series_ids_idx = headers.get("series_ids")
 
     for row_number, row in enumerate(rows[1:], start=2):
         if _row_has_no_value(row):
             continue
-        raw_work_id = cell(row, headers, "work_id")
+        raw_work_id = cell_at(row, work_id_idx)
         if raw_work_id in {None, ""}:
             continue
         total_candidate_rows += 1
@@ -318,13 +384,13 @@ def _build_work_import_plan(source_records: CatalogueSourceRecords, workbook, wo
             duplicate_ids.append(work_id)
             continue
 
-        title = normalize_scalar_text(cell(row, headers, "title"))
+        title = normalize_scalar_text(cell_at(row, title_idx))
         if not title:
             _append_blocked(blocked_rows, blocked_reason_counts, row_number=row_number, record_id=work_id, reason="missing_title", message="title is required")
             continue
 
         try:
-            series_ids = parse_series_ids(cell(row, headers, "series_ids"))
+            series_ids = parse_series_ids(cell_at(row, series_ids_idx))
         except ValueError as exc:
             _append_blocked(
                 blocked_rows,
@@ -356,10 +422,8 @@ def _build_work_import_plan(source_records: CatalogueSourceRecords, workbook, wo
             "published_date": None,
             "series_ids": [normalize_series_id(series_id) for series_id in series_ids],
         }
-        for field_name in WORK_FIELDS:
-            if field_name in record or field_name in {"status", "published_date"}:
-                continue
-            record[field_name] = normalize_json_value(cell(row, headers, field_name))
+        for field_name, idx in copied_field_columns:
+            record[field_name] = normalize_json_value(cell_at(row, idx))
         if normalize_text(record.get("project_filename")) and not normalize_text(record.get("media_version")):
             record["media_version"] = 1
         normalized_record = normalize_source_record(record, WORK_FIELDS, text_fields=WORK_TEXT_FIELDS)
@@ -378,8 +442,12 @@ def _build_work_import_plan(source_records: CatalogueSourceRecords, workbook, wo
     )
 
 
-def _build_work_detail_import_plan(source_records: CatalogueSourceRecords, workbook, workbook_path: Path) -> WorkbookImportPlan:
-    rows, headers = _require_sheet(workbook, "WorkDetails")
+def _build_work_detail_import_plan(
+    source_records: CatalogueSourceRecords,
+    rows: list[tuple[Any, ...]],
+    headers: Mapping[str, int],
+    workbook_path: Path,
+) -> WorkbookImportPlan:
     _require_headers(headers, ["work_id", "detail_id", "title", "section_title"], sheet_name="WorkDetails")
 
     importable: Dict[str, Dict[str, Any]] = {}
@@ -390,11 +458,25 @@ def _build_work_detail_import_plan(source_records: CatalogueSourceRecords, workb
     blocked_reason_counts: Dict[str, int] = {}
     seen_detail_uids: set[str] = set()
     total_candidate_rows = 0
+    copied_field_columns = column_indices(
+        headers,
+        [field_name for field_name in DETAIL_FIELDS if field_name not in {"detail_uid", "work_id", "detail_id", "section_id"}],
+    )
+    # Resolve key columns once; rows are then read positionally.
+    work_id_idx = headers.get("work_id")
+    detail_id_idx = headers.get("detail_id")
+    title_idx = headers.get("title")
+    project_subfolder_idx = headers.get("project_subfolder")
+    section_title_idx = headers.get("section_title")
+    details_subfolder_idx = headers.get("details_subfolder")
+    section_id_idx = headers.get("section_id")
+    section_order_idx = headers.get("section_order")
+    detail_sort_idx = headers.get("detail_sort")
     for row_number, row in enumerate(rows[1:], start=2):
         if _row_has_no_value(row):
             continue
-        raw_work_id = cell(row, headers, "work_id")
-        raw_detail_id = cell(row, headers, "detail_id")
+        raw_work_id = cell_at(row, work_id_idx)
+        raw_detail_id = cell_at(row, detail_id_idx)
         if raw_work_id in {None, ""} and raw_detail_id in {None, ""}:
             continue
         total_candidate_rows += 1
@@ -424,11 +506,11 @@ def _build_work_detail_import_plan(source_records: CatalogueSourceRecords, workb
             _append_blocked(blocked_rows, blocked_reason_counts, row_number=row_number, record_id=detail_uid, reason="parent_work_unpublished", message=f"parent work {work_id} must be published before adding work details")
             continue
 
-        title = normalize_scalar_text(cell(row, headers, "title"))
+        title = normalize_scalar_text(cell_at(row, title_idx))
         if not title:
             _append_blocked(blocked_rows, blocked_reason_counts, row_number=row_number, record_id=detail_uid, reason="missing_title", message="title is required")
             continue
-        if "project_subfolder" in headers and normalize_scalar_text(cell(row, headers, "project_subfolder")):
+        if project_subfolder_idx is not None and normalize_scalar_text(cell_at(row, project_subfolder_idx)):
             _append_blocked(
                 blocked_rows,
                 blocked_reason_counts,
@@ -438,18 +520,18 @@ def _build_work_detail_import_plan(source_records: CatalogueSourceRecords, workb
                 message="use details_subfolder instead of project_subfolder",
             )
             continue
-        section_title = normalize_scalar_text(cell(row, headers, "section_title"))
+        section_title = normalize_scalar_text(cell_at(row, section_title_idx))
         if not section_title:
             _append_blocked(blocked_rows, blocked_reason_counts, row_number=row_number, record_id=detail_uid, reason="missing_section_title", message="section_title is required")
             continue
-        details_subfolder = normalize_scalar_text(cell(row, headers, "details_subfolder")) or section_title
+        details_subfolder = normalize_scalar_text(cell_at(row, details_subfolder_idx)) or section_title
 
         record = {
             "detail_uid": detail_uid,
             "work_id": work_id,
             "detail_id": detail_id,
         }
-        raw_section_id = normalize_scalar_text(cell(row, headers, "section_id"))
+        raw_section_id = normalize_scalar_text(cell_at(row, section_id_idx))
         if raw_section_id:
             record["section_id"] = raw_section_id
         else:
@@ -480,18 +562,16 @@ def _build_work_detail_import_plan(source_records: CatalogueSourceRecords, workb
                 "work_id": work_id,
                 "details_subfolder": details_subfolder,
                 "section_title": section_title,
-                "section_order": normalize_json_value(cell(row, headers, "section_order")) if "section_order" in headers else None,
-                "detail_sort": normalize_json_value(cell(row, headers, "detail_sort")) if "detail_sort" in headers else None,
+                "section_order": normalize_json_value(cell_at(row, section_order_idx)) if section_order_idx is not None else None,
+                "detail_sort": normalize_json_value(cell_at(row, detail_sort_idx)) if detail_sort_idx is not None else None,
             }
             importable_sections[section_id] = normalize_source_record(
                 section_record,
                 DETAIL_SECTION_FIELDS,
                 text_fields=DETAIL_TEXT_FIELDS,
             )
-        for field_name in DETAIL_FIELDS:
-            if field_name in record:
-                continue
-            record[field_name] = normalize_json_value(cell(row, headers, field_name))
+        for field_name, idx in copied_field_columns:
+            record[field_name] = normalize_json_value(cell_at(row, idx))
         if normalize_text(record.get("project_filename")) and not normalize_text(record.get("media_version")):
             record["media_version"] = 1
         normalized_record = normalize_source_record(record, DETAIL_FIELDS, text_fields=DETAIL_TEXT_FIELDS)
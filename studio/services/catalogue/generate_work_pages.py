@@ -14,10 +14,10 @@ Studio-only work storage index JSON is written to studio/data/generated/activity
 - Series: series master data (1 row per series_id)
 - WorkDetails: additional detail images associated with a work
 
-YAML typing rules enforced by this script:
-- Numbers are emitted unquoted for: year, height_cm, width_cm, depth_cm
-- Everything else is emitted as a quoted string (including fields like year_display)
-- Empty values become YAML null
+JSON typing rules enforced by this script:
+- Numbers are emitted as JSON numbers for: year, height_cm, width_cm, depth_cm, width_px, height_px
+- Everything else is emitted as a string (including fields like year_display)
+- Empty values are omitted from generated records
 
 Safe by default:
 - dry-run unless you pass --write
@@ -49,13 +49,17 @@ Path variables used by the script:
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import datetime as dt
+import importlib.metadata
+import os
 import re
 import shutil
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 import json
 
@@ -85,6 +89,7 @@ try:
         coerce_int,
         coerce_string,
         compact_json_object,
+        compute_payload_hash_hex,
         is_empty,
         normalize_status,
         normalize_text,
@@ -102,6 +107,7 @@ except ModuleNotFoundError:  # pragma: no cover - package import fallback
         coerce_int,
         coerce_string,
         compact_json_object,
+        compute_payload_hash_hex,
         is_empty,
         normalize_status,
         normalize_text,
@@ -143,7 +149,7 @@ except ModuleNotFoundError:  # pragma: no cover - package import fallback
 try:
     from catalogue.catalogue_source import (
         DEFAULT_SOURCE_DIR as DEFAULT_CATALOGUE_SOURCE_DIR,
-        ordered_work_detail_sections,
+        ordered_work_detail_sections_by_work,
         records_from_json_source,
         validate_source_records,
         write_source_record_payloads,
@@ -151,7 +157,7 @@ try:
 except ModuleNotFoundError:  # pragma: no cover - package import fallback
     from catalogue.catalogue_source import (
         DEFAULT_SOURCE_DIR as DEFAULT_CATALOGUE_SOURCE_DIR,
-        ordered_work_detail_sections,
+        ordered_work_detail_sections_by_work,
         records_from_json_source,
         validate_source_records,
         write_source_record_payloads,
@@ -165,14 +171,23 @@ except ModuleNotFoundError:  # pragma: no cover - package import fallback
 PIPELINE_CONFIG = load_pipeline_config(Path(__file__))
 PROJECTS_BASE_DIR_ENV_NAME = env_var_name(PIPELINE_CONFIG, "projects_base_dir")
 CATALOGUE_PROSE_SOURCE_REL_DIR = Path("studio/data/canonical/catalogue-markdown")
+SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+WORK_ID_RANGE_PATTERN = re.compile(r"^(\d+)\s*-\s*(\d+)$")
+SIPS_PIXEL_WIDTH_PATTERN = re.compile(r"pixelWidth:\s*([0-9]+)")
+SIPS_PIXEL_HEIGHT_PATTERN = re.compile(r"pixelHeight:\s*([0-9]+)")
+IMAGE_DIMS_CACHE_REL_PATH = Path("var/studio/catalogue/cache/image-dims.json")
+WORK_JSON_INPUTS_CACHE_REL_PATH = Path("var/studio/catalogue/cache/work-json-inputs.json")
+SERIES_JSON_INPUTS_CACHE_REL_PATH = Path("var/studio/catalogue/cache/series-json-inputs.json")
+ACTIONABLE_WORK_STATUSES = frozenset({"draft", "published"})
+IMAGE_DIMS_PROBE_MAX_WORKERS = 8
 
 
 # ----------------------------
-# Helpers (ID/date/YAML parsing)
+# Helpers (ID/date parsing)
 # ----------------------------
-# These functions normalise source values and keep YAML output safe/consistent.
+# These functions normalise source values and keep generated JSON consistent.
 def is_slug_safe(s: str) -> bool:
-    return bool(re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", s))
+    return SLUG_PATTERN.match(s) is not None
 
 
 def require_slug_safe(label: str, raw: Any) -> str:
@@ -196,7 +211,7 @@ def parse_work_id_selection(raw: str) -> set[str]:
     """
     selected: set[str] = set()
     for token in (part.strip() for part in str(raw).split(",") if part.strip()):
-        m = re.match(r"^(\d+)\s*-\s*(\d+)$", token)
+        m = WORK_ID_RANGE_PATTERN.match(token)
         if m:
             start = int(m.group(1))
             end = int(m.group(2))
@@ -209,6 +224,30 @@ def parse_work_id_selection(raw: str) -> set[str]:
     return selected
 
 
+class RowLog:
+    """Buffer per-row progress lines and write them to stdout in batches."""
+
+    def __init__(self, batch_size: int = 256) -> None:
+        self.batch_size = batch_size
+        self.lines: List[str] = []
+
+    def __call__(self, line: str) -> None:
+        self.lines.append(line)
+        if len(self.lines) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self.lines:
+            return
+        sys.stdout.write("\n".join(self.lines) + "\n")
+        sys.stdout.flush()
+        self.lines.clear()
+
+
+# Per-row output goes through ROW_LOG; it is flushed before each section summary.
+ROW_LOG = RowLog()
+
+
 def log_event(event: str, details: Optional[Dict[str, Any]] = None) -> None:
     try:
         append_script_log(Path(__file__), event=event, details=details or {})
@@ -235,8 +274,22 @@ def load_recent_entries(path: Path) -> List[Dict[str, Any]]:
     return entries
 
 
+EXISTING_HEADER_PREFIX_BYTES = 4096
+
+
 def extract_existing_header_scalar(path: Path, key: str) -> Optional[str]:
-    """Extract header.<key> from an existing JSON payload."""
+    """
+    Extract header.<key> from an existing JSON payload; --force callers skip this read.
+    Generated payloads lead with a small header, so a bounded prefix read normally suffices.
+    """
+    try:
+        with path.open("rb") as handle:
+            prefix = handle.read(EXISTING_HEADER_PREFIX_BYTES)
+    except OSError:
+        return None
+    header = writes.decode_leading_header(prefix.decode("utf-8", errors="replace"))
+    if header is not None:
+        return writes.header_scalar(header, key)
     try:
         text = path.read_text(encoding="utf-8")
     except Exception:
@@ -244,6 +297,11 @@ def extract_existing_header_scalar(path: Path, key: str) -> Optional[str]:
     return writes.extract_header_scalar_from_json_text(text, key)
 
 
+def write_json_payload(path: Path, payload: Dict[str, Any]) -> None:
+    """Atomically write a generated JSON payload, keeping an existing file's mode."""
+    writes.write_bytes_atomically(path, writes.json_payload_bytes(payload))
+
+
 def write_index_json_payload(
     *,
     label: str,
@@ -255,7 +313,7 @@ def write_index_json_payload(
     display_path: Callable[[Path | str], str],
 ) -> bool:
     exists = path.exists()
-    existing_version = extract_existing_header_scalar(path, "version") if exists else None
+    existing_version = extract_existing_header_scalar(path, "version") if exists and not force else None
     decision = writes.decide_json_payload_write(
         path_exists=exists,
         existing_version=existing_version,
@@ -267,7 +325,7 @@ def write_index_json_payload(
         return False
 
     if write:
-        path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        write_json_payload(path, payload)
         print(f"{label} done. Wrote: 1. Skipped: 0. Path: {display_path(path)}")
     else:
         print(f"{label} done. Would write: 1. Skipped: 0. Path: {display_path(path)} (overwrite={exists})")
@@ -290,10 +348,10 @@ def parse_sips_pixel_dims(output: str) -> tuple[Optional[int], Optional[int]]:
     width = None
     height = None
     for line in output.splitlines():
-        m_w = re.search(r"pixelWidth:\s*([0-9]+)", line)
+        m_w = SIPS_PIXEL_WIDTH_PATTERN.search(line)
         if m_w:
             width = int(m_w.group(1))
-        m_h = re.search(r"pixelHeight:\s*([0-9]+)", line)
+        m_h = SIPS_PIXEL_HEIGHT_PATTERN.search(line)
         if m_h:
             height = int(m_h.group(1))
     return width, height
@@ -316,6 +374,180 @@ def read_image_dims_px(path: Path) -> tuple[Optional[int], Optional[int]]:
     return parse_sips_pixel_dims(proc.stdout)
 
 
+def load_cache_entries(path: Path) -> Dict[str, Any]:
+    """Load the entries map of a generator cache file under var/; missing or invalid caches are empty."""
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    entries = payload.get("entries") if isinstance(payload, dict) else None
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache_entries(path: Path, entries: Dict[str, Any]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"entries": entries}, ensure_ascii=False, sort_keys=True) + "\n", encoding="utf-8")
+    except OSError:
+        # Generator caches are an optimisation; failing to persist them must not block generation.
+        pass
+
+
+def load_image_dims_cache(path: Path) -> Dict[str, List[Any]]:
+    """Load cached source image dimensions keyed by source path."""
+    return {
+        key: value
+        for key, value in load_cache_entries(path).items()
+        if isinstance(value, list) and len(value) == 4
+    }
+
+
+def directory_file_names(path: Path) -> frozenset[str]:
+    """List file names in a directory with one scandir, for per-row existence checks."""
+    try:
+        with os.scandir(path) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+
+def file_state(path: Path) -> Optional[List[int]]:
+    """Return [size, mtime_ns] for an input file, or None when it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+# Third-party distributions behind render_markdown_to_html; their versions join the input fingerprint.
+RENDERER_DISTRIBUTIONS = ("markdown-it-py",)
+
+
+@lru_cache(maxsize=1)
+def generator_code_state() -> Dict[str, Any]:
+    """
+    File states of the modules and versions of the renderer packages that shape generated JSON,
+    so code or dependency changes invalidate input fingerprints. Computed once per run.
+    """
+    module_paths = [Path(__file__)]
+    for module_name in (
+        records.__name__,
+        writes.__name__,
+        compute_payload_hash_hex.__module__,
+        render_markdown_to_html.__module__,
+    ):
+        module_file = getattr(sys.modules.get(module_name), "__file__", None)
+        if module_file:
+            module_paths.append(Path(module_file))
+    package_versions: Dict[str, Optional[str]] = {}
+    for distribution in RENDERER_DISTRIBUTIONS:
+        try:
+            package_versions[distribution] = importlib.metadata.version(distribution)
+        except importlib.metadata.PackageNotFoundError:
+            package_versions[distribution] = None
+    return {
+        "modules": [file_state(path) for path in module_paths],
+        "packages": package_versions,
+    }
+
+
+class GeneratedJsonInputsCache:
+    """
+    Input fingerprints of generated JSON outputs from earlier --write runs, keyed by output path.
+    An output is current only while its inputs, its on-disk size/mtime and its header version all
+    still match what was recorded, so edited, replaced or reverted files are regenerated.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries = {
+            key: value
+            for key, value in load_cache_entries(path).items()
+            if isinstance(value, dict)
+        }
+        self.changed = False
+
+    def is_current(self, out_path: Path, input_fingerprint: str) -> bool:
+        entry = self.entries.get(os.path.abspath(out_path))
+        if entry is None or entry.get("inputs") != input_fingerprint:
+            return False
+        output_state = file_state(out_path)
+        if output_state is None or entry.get("output") != output_state:
+            return False
+        return extract_existing_header_scalar(out_path, "version") == entry.get("version")
+
+    def record(self, out_path: Path, input_fingerprint: str, version: str) -> None:
+        """Record an output that now holds `version` for these inputs; call after any write."""
+        entry = {"inputs": input_fingerprint, "output": file_state(out_path), "version": version}
+        key = os.path.abspath(out_path)
+        if self.entries.get(key) != entry:
+            self.entries[key] = entry
+            self.changed = True
+
+    def save(self) -> None:
+        if self.changed:
+            save_cache_entries(self.path, self.entries)
+            self.changed = False
+
+
+@lru_cache(maxsize=None)
+def read_image_dims_px_for_stat(path_text: str, size: int, mtime_ns: int) -> tuple[Optional[int], Optional[int]]:
+    """In-run memo keyed by file identity, so repeated or unreadable sources are only probed once."""
+    return read_image_dims_px(Path(path_text))
+
+
+def read_image_dims_px_cached(
+    path: Path,
+    cache: Dict[str, List[Any]],
+) -> tuple[Optional[int], Optional[int], bool]:
+    """
+    Read pixel dimensions, reusing cached values while the file size and mtime_ns are unchanged.
+    Returns (width, height, cache_updated).
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None, False
+    key = str(path)
+    cached = cache.get(key)
+    if cached is not None and cached[2] == st.st_size and cached[3] == st.st_mtime_ns:
+        return cached[0], cached[1], False
+    width, height = read_image_dims_px_for_stat(key, st.st_size, st.st_mtime_ns)
+    if width is None or height is None:
+        return width, height, False
+    cache[key] = [width, height, st.st_size, st.st_mtime_ns]
+    return width, height, True
+
+
+def prefetch_image_dims_px(paths: Iterable[Path], cache: Dict[str, List[Any]]) -> int:
+    """
+    Probe uncached source images concurrently so the serial refresh loop hits the in-run memo.
+    Each probe is a `sips` subprocess, so threads overlap the waits. Returns the number of probes.
+    """
+    pending: Dict[str, tuple[str, int, int]] = {}
+    for path in paths:
+        key = str(path)
+        if key in pending:
+            continue
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        cached = cache.get(key)
+        if cached is not None and cached[2] == st.st_size and cached[3] == st.st_mtime_ns:
+            continue
+        pending[key] = (key, st.st_size, st.st_mtime_ns)
+    if len(pending) < 2:
+        return 0
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(IMAGE_DIMS_PROBE_MAX_WORKERS, len(pending))
+    ) as executor:
+        for _dims in executor.map(lambda probe: read_image_dims_px_for_stat(*probe), pending.values()):
+            pass
+    return len(pending)
+
+
 def utc_timestamp_now() -> str:
     """Return current UTC timestamp formatted as YYYY-MM-DDTHH:MM:SSZ."""
     return dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -402,7 +634,14 @@ def main() -> None:
 
     # Write controls
     ap.add_argument("--write", action="store_true", help="Actually write files (otherwise dry-run)")
-    ap.add_argument("--force", action="store_true", help="Overwrite existing files")
+    ap.add_argument(
+        "--force",
+        action="store_true",
+        help=(
+            "Overwrite existing files and bypass the work/series JSON input caches "
+            "(needed after changes the cache fingerprint cannot see, e.g. edited config)"
+        ),
+    )
     ap.add_argument(
         "--refresh-published",
         action="store_true",
@@ -489,7 +728,10 @@ def main() -> None:
             "source": "json",
         },
     )
-    refresh_published = bool(args.refresh_published or args.force)
+    # Hot loops read these flags once per row; keep them as locals.
+    write_mode = bool(args.write)
+    force = bool(args.force)
+    refresh_published = bool(args.refresh_published or force)
 
     valid_artifacts = {
         "work-pages",
@@ -602,16 +844,22 @@ def main() -> None:
     series_sort_by_series_id = series_work_context.series_sort_by_series_id
     series_sort_fields_by_series_id = series_work_context.series_sort_fields_by_series_id
 
+    # Normalize work ids and statuses once; every works pass below iterates these rows.
+    work_rows: List[tuple[str, str, Dict[str, Any]]] = []
+    for work_record in source_records.works.values():
+        wid_raw = work_record.get("work_id")
+        if is_empty(wid_raw):
+            continue
+        work_rows.append((slug_id(wid_raw), normalize_status(work_record.get("status")), work_record))
+
     # Pre-index project folder by work_id for source media and dimension lookups.
     work_project_folder_by_id: Dict[str, str] = {}
     work_project_subfolder_by_id: Dict[str, str] = {}
     has_project_folder_col = any("project_folder" in work_record for work_record in source_records.works.values())
-    for work_record in source_records.works.values():
-        wid_raw = work_record.get("work_id")
+    for wid, _status, work_record in work_rows:
         pf_raw = work_record.get("project_folder")
-        if is_empty(wid_raw) or is_empty(pf_raw):
+        if is_empty(pf_raw):
             continue
-        wid = slug_id(wid_raw)
         work_project_folder_by_id[wid] = normalize_text(pf_raw)
         work_project_subfolder_by_id[wid] = normalize_text(work_record.get("project_subfolder"))
 
@@ -626,36 +874,39 @@ def main() -> None:
     run_work_dimension_refresh = run_work_json and not args.skip_source_dimension_refresh
 
     # Optional filtering: allow a specific list of work_ids (from file or comma-separated arg).
-    selected_ids = None
+    # Selections are frozen once; the row loops only test membership.
+    selected_ids: Optional[frozenset[str]] = None
     explicit_work_filter = bool(args.work_ids_file or args.work_ids)
     if args.work_ids_file:
         ids_path = Path(args.work_ids_file).expanduser()
         if not ids_path.exists():
             raise SystemExit(f"work_ids file not found: {ids_path}")
-        selected_ids = {slug_id(line.strip()) for line in ids_path.read_text(encoding="utf-8").splitlines() if line.strip()}
+        selected_ids = frozenset(
+            slug_id(line.strip()) for line in ids_path.read_text(encoding="utf-8").splitlines() if line.strip()
+        )
     elif args.work_ids:
-        selected_ids = parse_work_id_selection(args.work_ids)
+        selected_ids = frozenset(parse_work_id_selection(args.work_ids))
 
-    selected_series_ids = None
+    selected_series_ids: Optional[frozenset[str]] = None
     if args.series_ids_file:
         sids_path = Path(args.series_ids_file).expanduser()
         if not sids_path.exists():
             raise SystemExit(f"series_ids file not found: {sids_path}")
         try:
-            selected_series_ids = {
+            selected_series_ids = frozenset(
                 normalize_series_id(line.strip())
                 for line in sids_path.read_text(encoding="utf-8").splitlines()
                 if line.strip()
-            }
+            )
         except ValueError as exc:
             raise SystemExit(f"Invalid series_ids file value: {exc}") from exc
     elif args.series_ids:
         try:
-            selected_series_ids = {
+            selected_series_ids = frozenset(
                 normalize_series_id(sid.strip())
                 for sid in args.series_ids.split(",")
                 if sid.strip()
-            }
+            )
         except ValueError as exc:
             raise SystemExit(f"Invalid --series-ids value: {exc}") from exc
 
@@ -664,39 +915,35 @@ def main() -> None:
     # - otherwise skip work-page processing by default (backward compatible behavior)
     if selected_series_ids is not None and not explicit_work_filter:
         if selected_artifacts is not None and run_work_selection_scope:
-            selected_ids = set()
-            for work_record in source_records.works.values():
-                raw_work_id = work_record.get("work_id")
-                if is_empty(raw_work_id):
-                    continue
-                wid = slug_id(raw_work_id)
-                series_ids = records.parse_work_record_series_ids(work_record)
-                if any(sid in selected_series_ids for sid in series_ids):
-                    selected_ids.add(wid)
+            selected_ids = frozenset(
+                wid
+                for wid, _status, work_record in work_rows
+                if not selected_series_ids.isdisjoint(records.parse_work_record_series_ids(work_record))
+            )
         else:
-            selected_ids = set()
+            selected_ids = frozenset()
     source_validation_errors = validate_source_records(source_records)
     if source_validation_errors:
         raise SystemExit("JSON source validation failed: " + "; ".join(source_validation_errors[:20]))
 
+    # Works in scope with an actionable status, in source order.
+    actionable_work_rows = [
+        (wid, status, work_record)
+        for wid, status, work_record in work_rows
+        if (selected_ids is None or wid in selected_ids) and status in ACTIONABLE_WORK_STATUSES
+    ]
+
     work_dimensions_updated = 0
     work_project_folder_missing_warned = False
+    image_dims_cache_path = repo_root / IMAGE_DIMS_CACHE_REL_PATH
+    image_dims_cache: Dict[str, List[Any]] = {}
+    image_dims_cache_changed = False
     if run_work_dimension_refresh:
-        for work_record in source_records.works.values():
-            raw_work_id = work_record.get("work_id")
-            if is_empty(raw_work_id):
-                continue
-            wid = slug_id(raw_work_id)
-            if selected_ids is not None and wid not in selected_ids:
-                continue
-            status = normalize_status(work_record.get("status"))
-            if status not in {"draft", "published"}:
-                continue
-
-            width_px = coerce_int(work_record.get("width_px"))
-            height_px = coerce_int(work_record.get("height_px"))
+        image_dims_cache = load_image_dims_cache(image_dims_cache_path)
+        # Resolve every source path first so cache misses can be probed in parallel.
+        work_source_path_plans = []
+        for wid, _status, work_record in actionable_work_rows:
             project_filename = coerce_string(work_record.get("project_filename"))
-
             source_path_plan = source_updates.plan_work_image_source_path(
                 work_id=wid,
                 project_filename=project_filename,
@@ -705,16 +952,26 @@ def main() -> None:
                 projects_root=projects_root,
                 has_project_folder_column=has_project_folder_col,
             )
+            work_source_path_plans.append((wid, work_record, project_filename, source_path_plan))
+        prefetch_image_dims_px(
+            (plan.source_path for _wid, _record, _filename, plan in work_source_path_plans if plan.source_path is not None),
+            image_dims_cache,
+        )
+        for wid, work_record, project_filename, source_path_plan in work_source_path_plans:
+            width_px = coerce_int(work_record.get("width_px"))
+            height_px = coerce_int(work_record.get("height_px"))
+
             if source_path_plan.warning is not None and not work_project_folder_missing_warned:
                 if source_path_plan.warning.code == source_updates.NO_PROJECT_FOLDER_COLUMN:
-                    print("Warning: work source records have no project_folder values; cannot persist work image dimensions.")
+                    ROW_LOG("Warning: work source records have no project_folder values; cannot persist work image dimensions.")
                 else:
-                    print("Warning: missing Works.project_folder for one or more works; cannot persist those image dimensions.")
+                    ROW_LOG("Warning: missing Works.project_folder for one or more works; cannot persist those image dimensions.")
                 work_project_folder_missing_warned = True
 
             src_path = source_path_plan.source_path
             if src_path is not None:
-                src_w, src_h = read_image_dims_px(src_path)
+                src_w, src_h, cache_updated = read_image_dims_px_cached(src_path, image_dims_cache)
+                image_dims_cache_changed = image_dims_cache_changed or cache_updated
                 if src_w is not None and src_h is not None:
                     dimension_plan = source_updates.plan_dimension_update(
                         record_kind=source_updates.WORK_RECORD,
@@ -726,19 +983,23 @@ def main() -> None:
                     )
                     width_px = dimension_plan.width_px
                     height_px = dimension_plan.height_px
-                    if args.write and dimension_plan.updates:
+                    if write_mode and dimension_plan.updates:
                         update_source_work_record(wid, **dimension_plan.updates)
                         work_dimensions_updated += 1
                 else:
-                    print(f"Warning: could not read dimensions for work primary source image: {display_projects_path(src_path)}")
+                    ROW_LOG(f"Warning: could not read dimensions for work primary source image: {display_projects_path(src_path)}")
             elif project_filename:
-                print(f"Warning: could not resolve work primary source image path for {wid} ({project_filename})")
+                ROW_LOG(f"Warning: could not resolve work primary source image path for {wid} ({project_filename})")
 
             meta = work_meta_by_id.get(wid)
             if meta is not None:
                 meta["width_px"] = width_px
                 meta["height_px"] = height_px
 
+        if write_mode and image_dims_cache_changed:
+            save_cache_entries(image_dims_cache_path, image_dims_cache)
+        ROW_LOG.flush()
+
     canonical_work_record_by_id: Dict[str, Dict[str, Any]] = {}
     for wid in sorted(work_meta_by_id.keys()):
         record = records.build_canonical_work_record(
@@ -751,19 +1012,6 @@ def main() -> None:
         if record is not None:
             canonical_work_record_by_id[wid] = record
 
-    total = 0
-    if run_work_processing:
-        for work_record in source_records.works.values():
-            raw_work_id = work_record.get("work_id")
-            if is_empty(raw_work_id):
-                continue
-            wid = slug_id(raw_work_id)
-            if selected_ids is not None and wid not in selected_ids:
-                continue
-            status = normalize_status(work_record.get("status"))
-            if source_updates.is_actionable_status(status, refresh_published=refresh_published):
-                total += 1
-
     status_updated = 0
     published_date_updated = 0
     work_publish_transitions: List[Dict[str, Any]] = []
@@ -771,7 +1019,7 @@ def main() -> None:
     if requested_work_pages and selected_artifacts is not None:
         print("Work route stubs retired: work-pages maps to current work JSON/index generation.")
 
-    if args.write and (
+    if write_mode and (
         status_updated > 0
         or work_dimensions_updated > 0
     ):
@@ -783,7 +1031,7 @@ def main() -> None:
             print(f"Updated work width_px/height_px for {work_dimensions_updated} row(s).")
     if run_work_processing:
         print(f"Catalogue source: {display_path(json_source_dir)}")
-        if args.write:
+        if write_mode:
             print("Canonical source write-back runs after generation completes.")
     else:
         print("Work pages skipped: not selected by --only.")
@@ -824,20 +1072,10 @@ def main() -> None:
         tag_assignments_series = tag_assignments_payload.get("series", {})
         tag_assignments_changed = False
         tag_assignments_added = 0
-        s_total = 0
-        for series_record in source_records.series.values():
-            sid_raw = series_record.get("series_id")
-            if is_empty(sid_raw):
-                continue
-            sid = normalize_series_id(sid_raw)
-            if series_page_selected_ids is not None and sid not in series_page_selected_ids:
-                continue
-            status = normalize_status(series_record.get("status"))
-            if is_actionable_series_status(status):
-                s_total += 1
-        s_processed = 0
 
         if run_series_pages:
+            # Resolve scope and status once; the actionable rows also give the progress total.
+            actionable_series_rows: List[tuple[str, str, Dict[str, Any]]] = []
             for series_record in source_records.series.values():
                 sid_raw = series_record.get("series_id")
                 if is_empty(sid_raw):
@@ -852,8 +1090,17 @@ def main() -> None:
                 if not is_actionable_series_status(status):
                     series_skipped += 1
                     continue
-
-                s_processed += 1
+                actionable_series_rows.append((series_id, status, series_record))
+            s_total = len(actionable_series_rows)
+            series_json_names = directory_file_names(series_json_dir)
+            series_doc_urls_by_id = catalogue_document_urls["series"]
+            series_prose_names = directory_file_names(catalogue_prose_source_root / "series")
+            series_record_schema_version = records.SERIES_RECORD_SCHEMA_VERSION
+            code_state = generator_code_state()
+            # Same input-fingerprint gate as work JSON: unchanged series skip prose rendering and hashing.
+            series_json_inputs = GeneratedJsonInputsCache(repo_root / SERIES_JSON_INPUTS_CACHE_REL_PATH)
+
+            for s_processed, (series_id, status, series_record) in enumerate(actionable_series_rows, start=1):
                 title_raw = series_record.get("title")
                 series_title = coerce_string(title_raw) or series_id
 
@@ -868,10 +1115,11 @@ def main() -> None:
                 if year_display is None:
                     year_display = str(year) if year is not None else None
 
-                series_work_ids_sorted = sorted(
+                # Series work id lists are already sorted by work_id.
+                series_work_ids_sorted = [
                     work_id for work_id in work_ids_by_series_all.get(series_id, [])
                     if work_status_by_id.get(work_id) == "published"
-                )
+                ]
                 try:
                     indexes.require_series_primary_work_id(
                         series_id,
@@ -895,41 +1143,9 @@ def main() -> None:
 
                 public_series_record = records.build_series_json_record(
                     series_output_record,
-                    doc_urls=catalogue_document_urls["series"].get(series_id, []),
+                    doc_urls=series_doc_urls_by_id.get(series_id, []),
                 )
-                source_prose_path = resolve_series_prose_source_path(series_id)
-                content_html: Optional[str] = None
-                if source_prose_path.exists():
-                    content_html = render_catalogue_prose_markdown(source_prose_path)
-
-                payload = records.build_series_json_payload(
-                    series_id=series_id,
-                    series_record=public_series_record,
-                    content_html=content_html,
-                    generated_at_utc=utc_timestamp_now(),
-                    count=len(series_work_ids_sorted),
-                )
-                payload_version = payload["header"]["version"]
-                out_json_path = series_json_dir / f"{series_id}.json"
-                out_exists = out_json_path.exists()
-                existing_payload_version = extract_existing_header_scalar(out_json_path, "version") if out_exists else None
-                json_decision = writes.decide_json_payload_write(
-                    path_exists=out_exists,
-                    existing_version=existing_payload_version,
-                    payload_version=payload_version,
-                    force=args.force,
-                )
-                if not json_decision.should_write:
-                    series_json_skipped += 1
-                else:
-                    if args.write:
-                        out_json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-                        print(f"[Series JSON {s_processed}/{s_total}] WRITE: {display_path(out_json_path)}")
-                        series_json_written += 1
-                    else:
-                        print(f"[Series JSON {s_processed}/{s_total}] DRY-RUN: would write {display_path(out_json_path)} (overwrite={out_exists})")
-                        series_json_written += 1
-
+                # Tag assignment sync comes first: the series JSON gates below end the row early.
                 if series_id not in tag_assignments_series:
                     tag_assignments_series[series_id] = {
                         "tags": [],
@@ -954,6 +1170,63 @@ def main() -> None:
                         if "works" not in assignment_row or not isinstance(assignment_row.get("works"), dict):
                             assignment_row["works"] = {}
                             tag_assignments_changed = True
+
+                source_prose_path = resolve_series_prose_source_path(series_id)
+                source_prose_state = (
+                    file_state(source_prose_path) if source_prose_path.name in series_prose_names else None
+                )
+                out_json_path = series_json_dir / f"{series_id}.json"
+                out_exists = out_json_path.name in series_json_names
+                input_fingerprint = compute_payload_hash_hex(
+                    {
+                        "schema": series_record_schema_version,
+                        "code": code_state,
+                        "series": public_series_record,
+                        "count": len(series_work_ids_sorted),
+                        "prose": source_prose_state,
+                    }
+                )
+                if out_exists and not force and series_json_inputs.is_current(out_json_path, input_fingerprint):
+                    series_json_skipped += 1
+                    continue
+
+                content_html: Optional[str] = None
+                if source_prose_state is not None:
+                    content_html = render_catalogue_prose_markdown(source_prose_path)
+                payload = records.build_series_json_payload(
+                    series_id=series_id,
+                    series_record=public_series_record,
+                    content_html=content_html,
+                    generated_at_utc=utc_timestamp_now(),
+                    count=len(series_work_ids_sorted),
+                )
+                payload_version = payload["header"]["version"]
+                existing_payload_version = (
+                    extract_existing_header_scalar(out_json_path, "version") if out_exists and not force else None
+                )
+                json_decision = writes.decide_json_payload_write(
+                    path_exists=out_exists,
+                    existing_version=existing_payload_version,
+                    payload_version=payload_version,
+                    force=force,
+                )
+
+                if not json_decision.should_write:
+                    if write_mode:
+                        series_json_inputs.record(out_json_path, input_fingerprint, payload_version)
+                    series_json_skipped += 1
+                    continue
+
+                if write_mode:
+                    write_json_payload(out_json_path, payload)
+                    series_json_inputs.record(out_json_path, input_fingerprint, payload_version)
+                    ROW_LOG(f"[Series JSON {s_processed}/{s_total}] WRITE: {display_path(out_json_path)}")
+                    series_json_written += 1
+                else:
+                    ROW_LOG(f"[Series JSON {s_processed}/{s_total}] DRY-RUN: would write {display_path(out_json_path)} (overwrite={out_exists})")
+                    series_json_written += 1
+
+            series_json_inputs.save()
         else:
             if selected_artifacts is not None and not artifact_enabled("series-pages"):
                 print("Series pages skipped: not selected by --only.")
@@ -962,13 +1235,13 @@ def main() -> None:
             print("Studio series pages disabled: skipped.")
             print("Tag assignments sync skipped: follows series-pages selection.")
 
+        ROW_LOG.flush()
         if run_series_pages:
             if tag_assignments_changed:
                 tag_assignments_payload["series"] = tag_assignments_series
                 tag_assignments_payload["updated_at_utc"] = utc_timestamp_now()
-                tag_assignments_text = json.dumps(tag_assignments_payload, indent=2, ensure_ascii=False) + "\n"
-                if args.write:
-                    tag_assignments_path.write_text(tag_assignments_text, encoding="utf-8")
+                if write_mode:
+                    write_json_payload(tag_assignments_path, tag_assignments_payload)
                     print(
                         f"Tag assignments sync: WRITE {display_path(tag_assignments_path)} "
                         f"(added missing entries: {tag_assignments_added})."
@@ -981,9 +1254,9 @@ def main() -> None:
             else:
                 print("Tag assignments sync: no missing series entries.")
 
-        print(f"Series pages done. {'Would write' if not args.write else 'Wrote'}: {series_written}. Skipped: {series_skipped}.")
+        print(f"Series pages done. {'Would write' if not write_mode else 'Wrote'}: {series_written}. Skipped: {series_skipped}.")
         print(
-            f"Series JSON done. {'Would write' if not args.write else 'Wrote'}: "
+            f"Series JSON done. {'Would write' if not write_mode else 'Wrote'}: "
             f"{series_json_written}. Skipped: {series_json_skipped}."
         )
         print("Studio series pages disabled: skipped.")
@@ -1003,8 +1276,8 @@ def main() -> None:
         path=series_index_json_path,
         payload=series_index_payload,
         payload_version=series_version,
-        write=args.write,
-        force=args.force,
+        write=write_mode,
+        force=force,
         display_path=display_path,
     )
 
@@ -1017,17 +1290,6 @@ def main() -> None:
         else:
             print("Work detail pages/JSON skipped: not selected by --only.")
     else:
-        projects_base_dir = Path(args.projects_base_dir).expanduser()
-        projects_root = projects_base_dir / source_works_root_subdir(PIPELINE_CONFIG)
-
-        # Build known works from source records to validate foreign-key references.
-        known_work_ids: set[str] = set()
-        for work_record in source_records.works.values():
-            wid_raw = work_record.get("work_id")
-            if is_empty(wid_raw):
-                continue
-            known_work_ids.add(slug_id(wid_raw))
-
         if requested_work_details_pages and selected_artifacts is not None:
             print("Work-detail route stubs retired: work-details-pages maps to current work JSON/index generation.")
 
@@ -1038,16 +1300,7 @@ def main() -> None:
             encountered_work_id_set: set[str] = set()
             detail_records_by_work: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
-            for work_record in source_records.works.values():
-                wid_raw = work_record.get("work_id")
-                if is_empty(wid_raw):
-                    continue
-                wid = slug_id(wid_raw)
-                if selected_ids is not None and wid not in selected_ids:
-                    continue
-                status = normalize_status(work_record.get("status"))
-                if status not in {"draft", "published"}:
-                    continue
+            for wid, _status, _work_record in actionable_work_rows:
                 if wid not in canonical_work_record_by_id:
                     continue
                 if wid not in encountered_work_id_set:
@@ -1079,11 +1332,21 @@ def main() -> None:
                 )
                 detail_records_by_work.setdefault(wid, {})[detail_uid] = detail_record
 
+            detail_sections_by_work = ordered_work_detail_sections_by_work(source_records, encountered_work_ids)
             wj_written = 0
             wj_skipped = 0
             wj_total = len(encountered_work_ids)
             wj_processed = 0
             generated_at_utc = utc_timestamp_now()
+            # Input fingerprints from earlier --write runs let unchanged works skip prose
+            # rendering and payload hashing entirely.
+            work_json_inputs = GeneratedJsonInputsCache(repo_root / WORK_JSON_INPUTS_CACHE_REL_PATH)
+            works_json_names = directory_file_names(works_json_dir)
+            work_prose_names = directory_file_names(catalogue_prose_source_root / "works")
+            # Per-run lookups hoisted out of the per-work loop.
+            work_doc_urls_by_id = catalogue_document_urls["work"]
+            work_record_schema_version = records.WORK_RECORD_SCHEMA_VERSION
+            code_state = generator_code_state()
 
             for wid in encountered_work_ids:
                 wj_processed += 1
@@ -1093,7 +1356,7 @@ def main() -> None:
 
                 source_sections = []
                 detail_payloads_by_uid = detail_records_by_work.get(wid, {})
-                for section in ordered_work_detail_sections(source_records, wid):
+                for section in detail_sections_by_work.get(wid, []):
                     details = [
                         detail_payloads_by_uid[detail.get("detail_uid")]
                         for detail in section.get("details", [])
@@ -1108,10 +1371,26 @@ def main() -> None:
                 details_total = sum(len(s.get("details", [])) for s in sections)
                 work_record = records.build_work_json_record(
                     canonical_work_record_by_id.get(wid, {"work_id": wid}),
-                    doc_urls=catalogue_document_urls["work"].get(wid, []),
+                    doc_urls=work_doc_urls_by_id.get(wid, []),
                 )
+                out_json_path = works_json_dir / f"{wid}.json"
+                exists = out_json_path.name in works_json_names
+                source_prose_state = file_state(source_prose_path) if source_prose_path.name in work_prose_names else None
+                input_fingerprint = compute_payload_hash_hex(
+                    {
+                        "schema": work_record_schema_version,
+                        "code": code_state,
+                        "work": work_record,
+                        "sections": sections,
+                        "prose": source_prose_state,
+                    }
+                )
+                if exists and not force and work_json_inputs.is_current(out_json_path, input_fingerprint):
+                    wj_skipped += 1
+                    continue
+
                 content_html: Optional[str] = None
-                if source_prose_path.exists():
+                if source_prose_state is not None:
                     content_html = render_catalogue_prose_markdown(source_prose_path)
                 payload = records.build_work_json_payload(
                     work_id=wid,
@@ -1121,31 +1400,34 @@ def main() -> None:
                     generated_at_utc=generated_at_utc,
                     count=details_total,
                 )
-                out_json_path = works_json_dir / f"{wid}.json"
-                exists = out_json_path.exists()
-                existing_version = extract_existing_header_scalar(out_json_path, "version") if exists else None
+                existing_version = extract_existing_header_scalar(out_json_path, "version") if exists and not force else None
                 payload_version = payload["header"]["version"]
                 json_decision = writes.decide_json_payload_write(
                     path_exists=exists,
                     existing_version=existing_version,
                     payload_version=payload_version,
-                    force=args.force,
+                    force=force,
                 )
 
                 if not json_decision.should_write:
+                    if write_mode:
+                        work_json_inputs.record(out_json_path, input_fingerprint, payload_version)
                     wj_skipped += 1
                     continue
 
-                if args.write:
-                    out_json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-                    print(f"{prefix_wj}WRITE: {display_path(out_json_path)}")
+                if write_mode:
+                    write_json_payload(out_json_path, payload)
+                    work_json_inputs.record(out_json_path, input_fingerprint, payload_version)
+                    ROW_LOG(f"{prefix_wj}WRITE: {display_path(out_json_path)}")
                     wj_written += 1
                 else:
-                    print(f"{prefix_wj}DRY-RUN: would write {display_path(out_json_path)} (overwrite={exists})")
+                    ROW_LOG(f"{prefix_wj}DRY-RUN: would write {display_path(out_json_path)} (overwrite={exists})")
                     wj_written += 1
 
+            work_json_inputs.save()
+            ROW_LOG.flush()
             print(
-                f"Work JSON done. {'Would write' if not args.write else 'Wrote'}: {wj_written}. Skipped: {wj_skipped}."
+                f"Work JSON done. {'Would write' if not write_mode else 'Wrote'}: {wj_written}. Skipped: {wj_skipped}."
             )
         else:
             print("Work detail JSON skipped: not selected by --only.")
@@ -1169,8 +1451,8 @@ def main() -> None:
         path=works_index_json_path,
         payload=payload,
         payload_version=payload_version,
-        write=args.write,
-        force=args.force,
+        write=write_mode,
+        force=force,
         display_path=display_path,
     )
 
@@ -1197,8 +1479,8 @@ def main() -> None:
         path=recent_index_json_path,
         payload=recent_index_payload,
         payload_version=recent_payload_version,
-        write=args.write,
-        force=args.force,
+        write=write_mode,
+        force=force,
         display_path=display_path,
     )
 
@@ -1212,12 +1494,15 @@ def main() -> None:
         path=work_storage_index_json_path,
         payload=work_storage_payload_out,
         payload_version=work_storage_payload_version,
-        write=args.write,
-        force=args.force,
+        write=write_mode,
+        force=force,
         display_path=display_path,
     )
 
-    if args.write:
+    # Source write-back is deferred to a single save at the end of the run. Every family is
+    # canonicalized and stale detail files are pruned; files whose bytes are already
+    # canonical are left untouched.
+    if write_mode:
         validate_source_records_for_writeback()
         synced_paths = write_source_record_payloads(json_source_dir, source_records)
         print("Catalogue source JSON write-back done.")
@@ -1238,9 +1523,11 @@ if __name__ == "__main__":
     try:
         main()
     except SystemExit as exc:
+        ROW_LOG.flush()
         code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
         log_event("generate_exit", {"status": "system_exit", "code": code})
         raise
     except Exception as exc:  # noqa: BLE001
+        ROW_LOG.flush()
         log_event("generate_exit", {"status": "error", "error": str(exc)})
         raise
@@ -133,11 +133,16 @@ def read_selected_ids(path_value: str) -> set[str]:
     ids_path = Path(path_value).expanduser()
     if not ids_path.exists():
         raise SystemExit(f"Error: {SELECTED_IDS_ENV_NAME} not found: {ids_path}")
-    return {
-        line.strip()
-        for line in ids_path.read_text(encoding="utf-8").splitlines()
-        if line.strip()
-    }
+    # Iterate the file lazily so large manifests never exist as one string plus a line list.
+    with ids_path.open("r", encoding="utf-8") as handle:
+        return {item_id for item_id in (line.strip() for line in handle) if item_id}
+
+
+def write_ids_file(path: Path, ids: Iterable[str]) -> None:
+    """Write one id per line; every line carries its own newline, so no ids means an empty file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode the manifest once and write raw bytes rather than going through a text wrapper.
+    path.write_bytes("".join(f"{item_id}\n" for item_id in ids).encode("utf-8"))
 
 
 def collect_sources(input_dir: Path) -> List[Path]:
@@ -427,12 +432,7 @@ def main() -> int:
         print(f"Deleted {len(processed_sources)} source file(s) from: {display_path(input_dir)}")
 
     if (not dry_run) and success_ids_env:
-        success_ids_path = Path(success_ids_env).expanduser()
-        success_ids_path.parent.mkdir(parents=True, exist_ok=True)
-        success_ids_path.write_text(
-            "\n".join(success_ids) + ("\n" if success_ids else ""),
-            encoding="utf-8",
-        )
+        write_ids_file(Path(success_ids_env).expanduser(), success_ids)
 
     print(f"Done. Primaries written to: {display_path(output_dir / PRIMARY_OUTPUT_SUBDIR)}")
     print(f"Done. Thumbnails written to: {display_path(output_dir / THUMB_OUTPUT_SUBDIR)}")
@@ -7,6 +7,7 @@ import json
 import os
 import sys
 import tempfile
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -297,6 +298,121 @@ def test_execute_local_media_plan_dry_run_suppresses_writes() -> None:
     assert not asset_thumb.exists()
 
 
+def test_execute_local_media_plan_runs_item_encodes_and_reports_primary_failure() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = root / "source.jpg"
+        source.write_bytes(b"source")
+        staged_source = root / "media/works/make_srcset_images/00001.jpg"
+        staged_thumb = root / "media/works/srcset_images/thumb/00001-thumb-96.webp"
+        primary_root = root / "media/works/srcset_images/primary"
+        plan = {
+            "tasks": [
+                {
+                    "kind": "work",
+                    "id": "00001",
+                    "status": "pending",
+                    "source_abs_path": str(source),
+                    "staged_source_abs_path": str(staged_source),
+                    "pending_staged_source": True,
+                    "pending_thumb_outputs": [{"size": 96, "absolute_path": str(staged_thumb)}],
+                    "pending_primary_outputs": [
+                        {"width": width, "absolute_path": str(primary_root / f"00001-primary-{width}.webp")}
+                        for width in (800, 1200, 1600)
+                    ],
+                    "pending_asset_thumbs": [],
+                }
+            ],
+        }
+
+        def fake_encode(src: Path, size: int, dest: Path) -> tuple[int, str]:
+            dest.write_bytes(f"{src.name}:{size}".encode("utf-8"))
+            return 0, ""
+
+        def failing_primary(src: Path, width: int, dest: Path) -> tuple[int, str]:
+            return (1, "encode failed") if width == 1200 else fake_encode(src, width, dest)
+
+        result = media.execute_local_media_plan(
+            root,
+            scope={},
+            write=True,
+            plan_builder=lambda *args, **kwargs: plan,
+            thumb_runner=fake_encode,
+            primary_runner=fake_encode,
+        )
+        primary_bytes = (primary_root / "00001-primary-1600.webp").read_bytes()
+        failed = media.execute_local_media_plan(
+            root,
+            scope={},
+            write=True,
+            plan_builder=lambda *args, **kwargs: plan,
+            thumb_runner=fake_encode,
+            primary_runner=failing_primary,
+        )
+
+    assert result["status"] == "completed"
+    assert result["generated"] == {"work": ["00001"], "work_details": []}
+    assert primary_bytes == b"00001.jpg:1600"
+    assert failed["status"] == "failed"
+    assert failed["summary"] == "Local primary media generation failed for work 00001."
+    assert failed["stderr_tail"] == "encode failed"
+
+
+def test_run_ffmpeg_jobs_stops_at_a_failed_first_encode() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = root / "source.jpg"
+        calls: list[int] = []
+
+        def failing_encode(src: Path, size: int, dest: Path) -> tuple[int, str]:
+            calls.append(size)
+            return (1, "decode failed") if size in {96, 1200} else (0, "")
+
+        thumb_failure = media.run_ffmpeg_jobs(
+            [(failing_encode, source, size, root / f"{size}.webp") for size in (96, 800, 1600)]
+        )
+        thumb_calls = list(calls)
+        calls.clear()
+        primary_failure = media.run_ffmpeg_jobs(
+            [(failing_encode, source, size, root / f"{size}.webp") for size in (64, 800, 1200)]
+        )
+
+    assert thumb_failure == (0, 1, "decode failed")
+    assert thumb_calls == [96]
+    assert primary_failure == (2, 1, "decode failed")
+    assert media.run_ffmpeg_jobs([]) is None
+
+
+def test_stage_media_sources_stages_lazily_and_raises_per_item() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        copies = []
+        for index in range(media.MEDIA_STAGE_MAX_WORKERS + 2):
+            source = root / "source" / f"{index:05d}.jpg"
+            source.parent.mkdir(parents=True, exist_ok=True)
+            source.write_bytes(b"source")
+            copies.append((index, source, root / "staged" / source.name))
+        staged_sources = media.stage_media_sources(copies)
+        first_staged = next(staged_sources)
+        staged_sources.close()
+        last_staged_exists = copies[-1][2].exists()
+
+        missing_copies = [copies[0], (1, root / "source/missing.jpg", root / "staged/missing.jpg")]
+        failing_sources = media.stage_media_sources(missing_copies)
+        failing_first = next(failing_sources)
+        try:
+            next(failing_sources)
+        except FileNotFoundError:
+            raised = True
+        else:
+            raised = False
+
+    assert first_staged == (0, copies[0][2])
+    assert not last_staged_exists
+    assert failing_first == (0, copies[0][2])
+    assert raised
+
+
 def test_thumbnail_only_plan_skips_missing_sources_without_failing() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         root = Path(tmp)
@@ -331,6 +447,40 @@ def test_thumbnail_only_plan_skips_missing_sources_without_failing() -> None:
     assert plan["tasks"][2]["reason"] == "configured source media file is missing"
 
 
+def test_thumbnail_only_plan_compares_scanned_thumbnail_mtimes() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        repo_root = root / "repo"
+        source_dir = repo_root / "studio/data/canonical/catalogue"
+        projects_base = root / "projects"
+        source_image = projects_base / source_works_root_subdir(media.PIPELINE_CONFIG) / "2026/alpha/alpha.jpg"
+        source_image.parent.mkdir(parents=True, exist_ok=True)
+        source_image.write_bytes(b"source")
+        write_source_fixture(source_dir)
+        thumb_dir = repo_root / "site/assets/works/img"
+        touch_outputs([thumb_dir / "00001-thumb-96.webp"], newer_than=source_image)
+
+        current_plan = media.build_catalogue_thumbnail_only_plan(
+            repo_root,
+            source_dir=source_dir,
+            env=projects_env(projects_base),
+        )
+        stale_time = source_image.stat().st_mtime - 10
+        os.utime(thumb_dir / "00001-thumb-96.webp", (stale_time, stale_time))
+        stale_plan = media.build_catalogue_thumbnail_only_plan(
+            repo_root,
+            source_dir=source_dir,
+            env=projects_env(projects_base),
+        )
+        scanned = media.scan_file_mtimes(thumb_dir)
+        missing_dir_scan = media.scan_file_mtimes(root / "missing")
+
+    assert current_plan["counts"] == {"pending": 0, "current": 1, "skipped": 2}
+    assert stale_plan["counts"] == {"pending": 1, "current": 0, "skipped": 2}
+    assert list(scanned) == ["00001-thumb-96.webp"]
+    assert missing_dir_scan == {}
+
+
 def test_execute_thumbnail_only_plan_writes_thumbnails_and_reports_skips() -> None:
     with tempfile.TemporaryDirectory() as tmp:
         root = Path(tmp)
@@ -368,6 +518,85 @@ def test_execute_thumbnail_only_plan_writes_thumbnails_and_reports_skips() -> No
     assert not staged_root_exists
 
 
+def test_execute_thumbnail_only_plan_reports_records_in_plan_order_and_first_failure() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+
+        def pending_task(kind: str, item_id: str) -> dict[str, Any]:
+            return {
+                "kind": kind,
+                "id": item_id,
+                "status": "pending",
+                "source_abs_path": str(root / f"{item_id}.jpg"),
+                "pending_outputs": [{"size": 96, "absolute_path": str(root / "out" / f"{item_id}-thumb-96.webp")}],
+            }
+
+        tasks = [pending_task("work", "00001"), pending_task("work", "00002"), pending_task("work_details", "00001-001")]
+
+        def fake_plan(*_args: Any, **_kwargs: Any) -> dict[str, Any]:
+            return {"tasks": tasks, "counts": {}}
+
+        def fake_thumb(src: Path, size: int, dest: Path) -> tuple[int, str]:
+            dest.write_bytes(b"thumb")
+            return 0, ""
+
+        detail_started = threading.Event()
+
+        def failing_thumb(src: Path, size: int, dest: Path) -> tuple[int, str]:
+            if src.name == "00002.jpg":
+                # Fail only once the later record is in flight, so it must be drained and reported.
+                detail_started.wait(timeout=5)
+                return 1, "decode failed"
+            if src.name == "00001-001.jpg":
+                detail_started.set()
+            return fake_thumb(src, size, dest)
+
+        completed = media.execute_catalogue_thumbnail_only_plan(
+            root,
+            source_dir=root,
+            write=True,
+            plan_builder=fake_plan,
+            thumb_runner=fake_thumb,
+        )
+        failed = media.execute_catalogue_thumbnail_only_plan(
+            root,
+            source_dir=root,
+            write=True,
+            plan_builder=fake_plan,
+            thumb_runner=failing_thumb,
+        )
+        second_detail_started = threading.Event()
+
+        def twice_failing_thumb(src: Path, size: int, dest: Path) -> tuple[int, str]:
+            if src.name == "00002.jpg":
+                second_detail_started.wait(timeout=5)
+                return 1, "decode failed"
+            if src.name == "00001-001.jpg":
+                second_detail_started.set()
+                return 3, "detail decode failed"
+            return fake_thumb(src, size, dest)
+
+        failed_twice = media.execute_catalogue_thumbnail_only_plan(
+            root,
+            source_dir=root,
+            write=True,
+            plan_builder=fake_plan,
+            thumb_runner=twice_failing_thumb,
+        )
+
+    assert completed["status"] == "completed"
+    assert completed["generated"] == {"work": ["00001", "00002"], "work_details": ["00001-001"]}
+    assert failed["status"] == "failed"
+    assert failed["summary"] == "Thumbnail regeneration failed for work 00002."
+    assert failed["generated"] == {"work": ["00001"], "work_details": ["00001-001"]}
+    assert failed["stderr_tail"] == "decode failed"
+    assert failed_twice["summary"] == (
+        "Thumbnail regeneration failed for work 00002. 1 more record(s) also failed: work_details 00001-001 (exit 3)."
+    )
+    assert failed_twice["generated"] == {"work": ["00001"], "work_details": []}
+    assert failed_twice["exit_code"] == 1
+
+
 if __name__ == "__main__":
     test_parse_sips_pixel_dims()
     test_resolves_work_detail_sources_and_missing_metadata_reasons()
@@ -375,6 +604,11 @@ if __name__ == "__main__":
     test_local_media_plan_uses_transient_work_media_source()
     test_media_readiness_distinguishes_pending_and_missing_metadata()
     test_execute_local_media_plan_dry_run_suppresses_writes()
+    test_execute_local_media_plan_runs_item_encodes_and_reports_primary_failure()
+    test_run_ffmpeg_jobs_stops_at_a_failed_first_encode()
+    test_stage_media_sources_stages_lazily_and_raises_per_item()
     test_thumbnail_only_plan_skips_missing_sources_without_failing()
+    test_thumbnail_only_plan_compares_scanned_thumbnail_mtimes()
     test_execute_thumbnail_only_plan_writes_thumbnails_and_reports_skips()
+    test_execute_thumbnail_only_plan_reports_records_in_plan_order_and_first_failure()
     print("catalogue build media checks passed")
@@ -106,6 +106,11 @@ def test_series_context_sorts_title_aliases_and_numeric_values() -> None:
         "00004": "001-00004",
         "00002": "002-00002",
     }
+    assert context.work_ids_by_series_all == {
+        "009": ["00001", "00002", "00003"],
+        "010": ["00002", "00004"],
+        "011": ["00005"],
+    }
 
 
 def test_series_index_payload_is_published_only_and_validates_primary_work() -> None:
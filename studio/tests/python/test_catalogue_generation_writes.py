@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import sys
 from pathlib import Path
 
+import pytest
+
 
 REPO_ROOT = Path(__file__).resolve().parents[3]
 SCRIPTS_DIR = REPO_ROOT / "scripts"
@@ -42,6 +45,42 @@ def test_json_header_scalar_extraction_is_tolerant() -> None:
     assert writes.extract_header_scalar_from_json_text("not json", "version") is None
 
 
+def test_json_header_scalar_reads_leading_header_without_parsing_body() -> None:
+    text = '{\n  "header": {\n    "schema": "work_v1",\n    "version": "abc"\n  },\n  "work": {truncated'
+
+    assert writes.extract_header_scalar_from_json_text(text, "version") == "abc"
+    assert writes.extract_header_scalar_from_json_text('{"work": {}, "header": {"version": "late"}}', "version") == "late"
+
+
+def test_leading_header_decodes_from_truncated_prefix() -> None:
+    assert writes.decode_leading_header('{"header": {"version": "abc", "count": 2}, "work": {"ti') == {
+        "version": "abc",
+        "count": 2,
+    }
+    assert writes.decode_leading_header('{"header": {"version": "ab') is None
+    assert writes.decode_leading_header('{"work": {}, "header": {"version": "late"}}') is None
+
+
+def test_json_payload_bytes_use_indented_utf8_json_and_reject_dates() -> None:
+    payload = {
+        "header": {"version": "abc", "count": 2},
+        "work": {"title": "Café – draft", "series_ids": [], "links": {}},
+        "values": [1e16, 1e-7, 12.5],
+        "series": {1: {"tags": []}},
+    }
+
+    assert writes.json_payload_bytes(payload) == (
+        '{\n'
+        '  "header": {\n    "version": "abc",\n    "count": 2\n  },\n'
+        '  "work": {\n    "title": "Café – draft",\n    "series_ids": [],\n    "links": {}\n  },\n'
+        '  "values": [\n    1e+16,\n    1e-07,\n    12.5\n  ],\n'
+        '  "series": {\n    "1": {\n      "tags": []\n    }\n  }\n'
+        '}\n'
+    ).encode("utf-8")
+    with pytest.raises(TypeError):
+        writes.json_payload_bytes({"published": dt.date(2026, 1, 1)})
+
+
 def test_json_version_match_skips_without_force() -> None:
     decision = writes.decide_json_payload_write(
         path_exists=True,
@@ -83,3 +122,16 @@ def test_json_dry_run_decision_does_not_write_files(tmp_path: Path) -> None:
     assert decision.should_write is True
     assert decision.overwrite is False
     assert not target.exists()
+
+
+def test_write_bytes_atomically_keeps_mode_and_skips_identical_bytes(tmp_path: Path) -> None:
+    target = tmp_path / "payload.json"
+    target.write_bytes(b"old\n")
+    target.chmod(0o600)
+
+    assert writes.write_bytes_atomically(target, b"new\n") is True
+    assert target.read_bytes() == b"new\n"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert writes.write_bytes_atomically(target, b"new\n", skip_identical=True) is False
+    assert writes.write_bytes_atomically(target, b"new\n") is True
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["payload.json"]
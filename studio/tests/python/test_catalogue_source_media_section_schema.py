@@ -13,6 +13,8 @@ sys.path.insert(0, str(REPO_ROOT / "studio/services"))
 from catalogue.catalogue_source import (  # noqa: E402
     CatalogueSourceRecords,
     next_detail_section_id,
+    ordered_work_detail_sections,
+    ordered_work_detail_sections_by_work,
     validate_source_records,
     validate_work_detail_media_section_record,
     validate_work_detail_section_record,
@@ -158,6 +160,30 @@ def assert_detail_section_id_must_match_section_work() -> None:
     assert any("belongs to work_id '00002'" in error for error in errors), errors
 
 
+def assert_grouped_detail_sections_match_per_work_order() -> None:
+    records = source_records_with_detail(
+        {
+            "detail_uid": "00001-001",
+            "work_id": "00001",
+            "detail_id": "001",
+            "section_id": "00001-1",
+            "project_filename": "detail.jpg",
+            "title": "Detail",
+        }
+    )
+    records.work_details["00001-002"] = {
+        "detail_uid": "00001-002",
+        "work_id": "00001",
+        "detail_id": "002",
+        "section_id": "00001-1",
+        "title": "Second",
+    }
+    grouped = ordered_work_detail_sections_by_work(records, ["00001", "00002"])
+    assert grouped == {"00001": ordered_work_detail_sections(records, "00001")}, grouped
+    assert [detail["detail_uid"] for detail in grouped["00001"][0]["details"]] == ["00001-001", "00001-002"]
+    assert ordered_work_detail_sections(records, "00002") == []
+
+
 def main() -> int:
     assert_target_detail_schema_accepts_new_fields()
     assert_detail_schema_rejects_retired_detail_section_fields()
@@ -166,6 +192,7 @@ def main() -> int:
     assert_next_detail_section_id_uses_hyphen_suffix()
     assert_media_version_is_required_for_media_records()
     assert_detail_section_id_must_match_section_work()
+    assert_grouped_detail_sections_match_per_work_order()
     print("catalogue source media section schema checks passed")
     return 0
 